@@ -45,14 +45,12 @@ Usage:
 import time
 import smartsheet
 import pandas as pd
-from pandas.tseries.offsets import CustomBusinessDay
-from datetime import datetime, timedelta
-import re
+from datetime import datetime
 import sys
 import os
 import json
-from glob import glob
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from defines import *
 from functions import *
@@ -63,556 +61,687 @@ from database_utils import execute_custom_query
 from config_manager import validate_config
 import logging
 
-# Configure logging based on DEBUG flag
-log_level = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
+logger = logging.getLogger(__name__)
 
-# Create SaveFiles directory if it doesn't exist (using absolute path from defines)
-save_files_dir = os.path.join(SCRIPT_DIR, 'SaveFiles')
-os.makedirs(save_files_dir, exist_ok=True)
 
-# Setup logging to both file and console
-log_handlers = [
-    logging.FileHandler(ERROR_LOG_PATH, mode='a'),
-    logging.StreamHandler(sys.stdout)
-]
+def setup_logging():
+    """Configures logging to the error log file, the console and (in DEBUG mode) the debug log file"""
+    # Configure logging based on DEBUG flag
+    log_level = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
 
-if DEBUG:
-    # Add debug log file handler when DEBUG is True
-    log_handlers.append(logging.FileHandler(DEBUG_LOG_PATH, mode='a'))
+    # Create SaveFiles directory if it doesn't exist (using absolute path from defines)
+    save_files_dir = os.path.join(SCRIPT_DIR, 'SaveFiles')
+    os.makedirs(save_files_dir, exist_ok=True)
 
-logging.basicConfig(
-    level=log_level,
-    format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=log_handlers
-)
+    # Setup logging to both file and console
+    log_handlers = [
+        logging.FileHandler(ERROR_LOG_PATH, mode='a'),
+        logging.StreamHandler(sys.stdout)
+    ]
 
-logger = logging.getLogger(__name__)
+    if DEBUG:
+        # Add debug log file handler when DEBUG is True
+        log_handlers.append(logging.FileHandler(DEBUG_LOG_PATH, mode='a'))
+
+    logging.basicConfig(
+        level=log_level,
+        format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=log_handlers
+    )
 
-# Track script start time for performance/debug
-script_start = time.time()
-logger.info(f"{'='*70}")
-logger.info(f"Script started - DEBUG Mode: {DEBUG}")
-logger.info(f"{'='*70}")
-print(f"Script started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-if DEBUG:
-    print(f"DEBUG MODE ENABLED - Detailed logs will be written to {DEBUG_LOG_PATH}")
-print(f"Error logs will be written to {ERROR_LOG_PATH}")
-
-#-------------------------------------------------------------------#
-#            Get smartsheet and convert to dataframe
-#-------------------------------------------------------------------#
-t_convert_start = time.time()
-
-try:
-    logger.info("Attempting to connect to Smartsheet API...")
-    ACCESS_TOKEN = get_api_key_file()
-    logger.debug(f"API token retrieved successfully (length: {len(ACCESS_TOKEN)})")
-    
-    smartsheet_client = smartsheet.Smartsheet(ACCESS_TOKEN)
-    smartsheet_client.errors_as_exceptions(True)
-    logger.info("Smartsheet client initialized")
-
-    logger.info(f"Fetching Smartsheet ID: {assembly_part_tracking_id}")
-    smartsheet_sheet = smartsheet_client.Sheets.get_sheet(assembly_part_tracking_id)
-    logger.info(f"Smartsheet retrieved - Rows: {len(smartsheet_sheet.rows)}, Columns: {len(smartsheet_sheet.columns)}")
-    
-    smartsheet_part_tracking_df = convert_sheet_to_dataframe(smartsheet_sheet)
-    logger.info(f"Smartsheet converted to DataFrame - Shape: {smartsheet_part_tracking_df.shape}")
-    
-    if DEBUG or debug_output:
-        logger.debug(f"Smartsheet DataFrame columns: {smartsheet_part_tracking_df.columns.tolist()}")
-        logger.debug(f"First few rows of Smartsheet DataFrame:\n{smartsheet_part_tracking_df.head()}")
-        print("Smartsheet DataFrame columns:", smartsheet_part_tracking_df.columns.tolist())
-        print("First few rows of Smartsheet DataFrame:")
-        print(smartsheet_part_tracking_df.head())
-        if '_row_id' in smartsheet_part_tracking_df.columns:
-            logger.debug(f"_row_id sample: {smartsheet_part_tracking_df['_row_id'].head().tolist()}")
-            print("_row_id sample:", smartsheet_part_tracking_df['_row_id'].head().tolist())
-    
-    if smartsheet_part_tracking_df.empty:
-        logger.warning("WARNING: Smartsheet DataFrame is EMPTY! This might be expected if starting fresh.")
-        print("⚠ WARNING: Smartsheet is empty. Continuing with empty DataFrame...")
-
-except FileNotFoundError as e:
-    logger.error(f"File not found error accessing API key: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Cannot find API key file. Check file paths in local_secrets.py")
-    sys.exit(1)
-except smartsheet.exceptions.ApiError as e:
-    logger.error(f"Smartsheet API error: {e}")
-    logger.error(f"Error code: {e.error.result.error_code if hasattr(e.error, 'result') else 'Unknown'}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Smartsheet API error - {e}")
-    print(f"This could be due to: invalid token, no network access, or incorrect sheet ID")
-    sys.exit(1)
-except Exception as e:
-    logger.error(f"Unexpected error converting Smartsheet data: {e}")
-    logger.error(f"Error type: {type(e).__name__}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to load Smartsheet - {e}")
-    sys.exit(1)
-
-t_convert_end = time.time() - t_convert_start
-
-#-------------------------------------------------------------------#
-#            Store smartsheet user entered infomration 
-#-------------------------------------------------------------------#
-t_smartsheet_data_start = time.time()
-
-try:
-    logger.info("Storing Smartsheet user-entered data...")
-    store_smartsheet_user_data(smartsheet_part_tracking_df, USE_COLOR_PROGRESS_BAR)
-    logger.info("User-entered data stored successfully")
-except Exception as e:
-    logger.error(f"Error storing Smartsheet user data: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to store user-entered data - {e}")
-
-t_smartsheet_data_end = time.time() - t_smartsheet_data_start
-
-#-------------------------------------------------------------------#
-#          Get camData (ETHAR) and convert to dataframe
-#-------------------------------------------------------------------#
-t_camData_start = time.time()
-
-try:
-    logger.info("Loading assembly job tracking data from network directory...")
-    logger.info(f"Network directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
-    
-    # Verify network directory exists
-    if not os.path.exists(ASSEMBLY_ACTIVE_DIRECTORY):
-        logger.error(f"Network directory does not exist: {ASSEMBLY_ACTIVE_DIRECTORY}")
-        raise FileNotFoundError(f"Cannot access network directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
-    
-    if not os.path.isdir(ASSEMBLY_ACTIVE_DIRECTORY):
-        logger.error(f"Path is not a directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
-        raise NotADirectoryError(f"Path is not a directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
-    
-    # Check directory permissions
+
+def start_smartsheet_download():
+    """
+    Connects to Smartsheet and starts downloading the assembly part tracking sheet in a background
+    thread, so the download overlaps with loading camData from the network directory.
+
+    Returns:
+        tuple: (smartsheet_client, smartsheet_executor, smartsheet_future) - the future resolves to the
+               sheet returned by smartsheet_client.Sheets.get_sheet()
+    """
     try:
-        test_list = os.listdir(ASSEMBLY_ACTIVE_DIRECTORY)
-        logger.debug(f"Found {len(test_list)} entries in network directory")
-    except PermissionError as pe:
-        logger.error(f"Permission denied accessing network directory: {pe}")
-        raise
-    
-    # Handle missing or empty JSON file
-    if not os.path.isfile(LOG_CAM_DATA) or os.path.getsize(LOG_CAM_DATA) == 0:
-        logger.info(f"No existing cam data log found at {LOG_CAM_DATA}, starting fresh")
-        old_data = []
-    else:
-        try:
-            with open(LOG_CAM_DATA, "r") as f:
-                old_data = json.load(f)
-            logger.debug(f"Loaded {len(old_data)} existing cam data records")
-        except json.JSONDecodeError as je:
-            logger.warning(f"JSON decode error in {LOG_CAM_DATA}: {je}. Starting fresh.")
-            old_data = []
-        except Exception as read_err:
-            logger.warning(f"Error reading {LOG_CAM_DATA}: {read_err}. Starting fresh.")
-            old_data = []
-
-    # Load assembly job tracking data from camReadme.txt files
-    logger.info("Scanning camReadme.txt files...")
-    assembly_job_tracking_df = load_assembly_job_data(ASSEMBLY_ACTIVE_DIRECTORY, LOG_CAM_DATA)
-   
-    # Function returns a tuple (df, _), use only the first
-    if isinstance(assembly_job_tracking_df, tuple):
-        assembly_job_tracking_df = assembly_job_tracking_df[0]
-        logger.debug("Extracted DataFrame from tuple return")
-
-    logger.info(f"Loaded {len(assembly_job_tracking_df)} job records from camReadme files")
-    
-    if assembly_job_tracking_df.empty:
-        logger.warning("WARNING: No job data found in camReadme.txt files!")
-        print("⚠ WARNING: No assembly jobs found. Check if network directory has job folders.")
-    
-    # Sanitize data - fix invalid numeric and date fields
-    logger.info("Sanitizing data fields...")
-    assembly_job_tracking_df, data_corrections = sanitize_cam_data(assembly_job_tracking_df)
-    
-    if data_corrections:
-        # Save corrections report
-        corrections_file = os.path.join(SCRIPT_DIR, 'SaveFiles', 'data_corrections.json')
+        logger.info("Attempting to connect to Smartsheet API...")
+        smartsheet_client = get_smartsheet_client()
+        logger.info("Smartsheet client initialized")
+
+        # Download the sheet in a background thread while camData is loaded from the
+        # network directory below - the two are independent and both are IO bound
+        logger.info(f"Fetching Smartsheet ID: {assembly_part_tracking_id}")
+        smartsheet_executor = ThreadPoolExecutor(max_workers=1)
+        # Empty cells are left out of the response; convert_sheet_to_dataframe treats missing cells as empty
+        smartsheet_future = smartsheet_executor.submit(
+            smartsheet_client.Sheets.get_sheet, assembly_part_tracking_id, exclude='nonexistentCells')
+
+    except FileNotFoundError as e:
+        logger.error(f"File not found error accessing API key: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Cannot find API key file. Check file paths in local_secrets.py")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error connecting to Smartsheet: {e}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to load Smartsheet - {e}")
+        sys.exit(1)
+
+    return smartsheet_client, smartsheet_executor, smartsheet_future
+
+
+def load_camdata(timings):
+    """
+    Loads camData (ETHAR) from the camReadme.txt files in the active assembly directory, sanitizes it
+    and saves it back to the cam data log.
+
+    Args:
+        timings (dict): Per-stage timings (ns) - sub-stage timings are added to it
+
+    Returns:
+        tuple: (assembly_job_tracking_df, job_directories) - the assembly job tracking data (empty if
+               it could not be loaded) and the job directory names listed for the scan (None if the
+               directory could not be listed)
+    """
+    job_directories = None
+    try:
+        logger.info("Loading assembly job tracking data from network directory...")
+        logger.info(f"Network directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
+
+        # Verify network directory exists
+        if not os.path.exists(ASSEMBLY_ACTIVE_DIRECTORY):
+            logger.error(f"Network directory does not exist: {ASSEMBLY_ACTIVE_DIRECTORY}")
+            raise FileNotFoundError(f"Cannot access network directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
+
+        if not os.path.isdir(ASSEMBLY_ACTIVE_DIRECTORY):
+            logger.error(f"Path is not a directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
+            raise NotADirectoryError(f"Path is not a directory: {ASSEMBLY_ACTIVE_DIRECTORY}")
+
+        # List the job directories once (also checks directory permissions); the listing is
+        # reused by the master BOM and PO number stages
         try:
-            with open(corrections_file, 'w') as f:
-                json.dump(data_corrections, f, indent=2)
-            logger.info(f"Data corrections report saved to {corrections_file}")
-        except Exception as e:
-            logger.warning(f"Could not save corrections report: {e}")
-
-    # Add 'internal_status' column, blank for all rows
-    assembly_job_tracking_df['internal_status'] = ""
-
-    # Save updated data back to JSON file
-    assembly_job_tracking_df.to_json(LOG_CAM_DATA, orient="records", indent=2)
-    logger.info(f"Saved cam data to {LOG_CAM_DATA}")
-
-except FileNotFoundError as e:
-    logger.error(f"File/Directory not found: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Cannot access required files/directories - {e}")
-    print(f"Please verify network connection and directory paths.")
-    sys.exit(1)
-except PermissionError as e:
-    logger.error(f"Permission denied: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Permission denied accessing network directory - {e}")
-    print(f"Please check your network permissions.")
-    sys.exit(1)
-except Exception as e:
-    logger.error(f"Error loading assembly job tracking data: {e}")
-    logger.error(f"Error type: {type(e).__name__}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to load assembly job data - {e}")
-    # Initialize empty DataFrame to allow script to continue
-    assembly_job_tracking_df = pd.DataFrame()
-    assembly_job_tracking_df['internal_status'] = ""
-
-t_camData_end = time.time() - t_camData_start
-
-#-------------------------------------------------------------------#
-#         Build active assembly jobs and credit hold files
-#-------------------------------------------------------------------#
-t_active_jobs_file_start = time.time()
-
-try:
-    logger.info("Building active assembly jobs and credit hold files...")
-    # Load the source data from log_camData.json
-    cam_data = load_json_file(LOG_CAM_DATA, default_value=[])
-    logger.debug(f"Loaded {len(cam_data)} records from cam data")
-
-    # Load existing credit hold data to check for releases
-    existing_credit_holds = set()
-
-    existing_data = load_json_file(LOG_CREDIT_HOLD, default_value=[])
-
-    if existing_data:
-        # Extract WO# from existing credit hold records
-        existing_credit_holds = {record.get('WO#') for record in existing_data if record.get('WO#')}
-        logger.debug(f"Found {len(existing_credit_holds)} existing credit holds")
-
-    active_jobs, credit_hold_jobs, credit_hold_released = build_active_credithold_files(cam_data, existing_credit_holds)
-    logger.info(f"Built active jobs: {len(active_jobs)}, credit holds: {len(credit_hold_jobs)}, released: {len(credit_hold_released)}")
-
-    # Write active jobs to log_active_jobs.json
-    if save_json_file(active_jobs, LOG_ACTIVE_JOBS, create_dir=True):
-        logger.info(f"Active jobs saved successfully: {len(active_jobs)} records")
-        print(f"✓ Active jobs saved successfully: {len(active_jobs)} records")
-
-    # Write credit hold jobs to log_credit_hold.json
-    if save_json_file(credit_hold_jobs, LOG_CREDIT_HOLD, create_dir=True):
-        logger.info(f"Credit hold jobs saved successfully: {len(credit_hold_jobs)} records")
-        print(f"✓ Credit hold jobs saved successfully: {len(credit_hold_jobs)} records")
-
-    # Write credit hold jobs to log_credit_released.json
-    if save_json_file(credit_hold_released, LOG_CREDIT_RELEASED, create_dir=True):
-        logger.info(f"Credit hold released jobs saved successfully: {len(credit_hold_released)} records")
-        print(f"✓ Credit hold released jobs saved successfully: {len(credit_hold_released)} records")
-
-except Exception as e:
-    logger.error(f"Error building active assembly jobs file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build active jobs - {e}")
-    # Initialize variables to prevent NameError in subsequent code
-    active_jobs = []
-    credit_hold_jobs = []
-    credit_hold_released = []
-    cam_data = []
-
-t_active_jobs_file_time = time.time() - t_active_jobs_file_start
-
-#-------------------------------------------------------------------#
-#                    Build master BOM dataframe
-#-------------------------------------------------------------------#
-t_master_BOM_start = time.time()
-
-try:
-    logger.info("Building master BOM dataframe...")
-    master_bom_df = build_master_bom(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, debug_output)
-    logger.info(f"Master BOM built with {len(master_bom_df)} records")
-    if master_bom_df.empty:
-        logger.warning("WARNING: Master BOM is empty!")
-        print("⚠ WARNING: Master BOM is empty. Check if job folders contain BOM files.")
-except Exception as e:
-    logger.error(f"Error building master BOM dataframe: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build master BOM - {e}")
-    master_bom_df = pd.DataFrame()
-
-t_master_BOM_end = time.time() - t_master_BOM_start
-
-#-------------------------------------------------------------------#
-#                Add overage to master parts file
-#-------------------------------------------------------------------#
-t_reqd_parts_file_start = time.time()
-
-try:
-    logger.info("Adding purchasing overage to master BOM...")
-    master_bom_df = add_overage_to_master_bom(master_bom_df, QUOTE_DIR, False)
-    logger.info("Overage added successfully")
-except Exception as e:
-    logger.error(f"Error adding purchasing overage to master BOM: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to add overage - {e}")
-
-t_reqd_parts_file_end = time.time() - t_reqd_parts_file_start
-
-#-------------------------------------------------------------------#
-#                Build missing purchase parts file
-#-------------------------------------------------------------------#
-t_purchase_parts_file_start = time.time()
-
-try:
-    logger.info("Building missing purchase parts file...")
-    missing_purchase_parts_file(master_bom_df, LOG_MISSING_PURCH_PARTS, debug_output)
-    logger.info("Missing purchase parts file created")
-except Exception as e:
-    logger.error(f"Error building missing purchase parts file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build missing purchase parts - {e}")
-
-t_purchase_parts_file_end = time.time() - t_purchase_parts_file_start
-
-#-------------------------------------------------------------------#
-#           Build missing purchase parts designator file
-#-------------------------------------------------------------------#
-t_purchase_parts_designator_file_start = time.time()
-
-try:
-    logger.info("Building purchase parts designator file...")
-    missing_purchase_parts_designator_file(master_bom_df, LOG_PURCH_DESIGNATOR, debug_output)
-    logger.info("Purchase parts designator file created")
-except Exception as e:
-    logger.error(f"Error building purchase parts designator file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build purchase parts designator - {e}")
-
-t_purchase_parts_designator_file_end = time.time() - t_purchase_parts_designator_file_start
-
-#-------------------------------------------------------------------#
-#                Build missing customer parts file
-#-------------------------------------------------------------------#
-t_customer_parts_file_start = time.time()
-
-try:
-    logger.info("Building missing customer parts file...")
-    missing_cust_parts_file(master_bom_df, LOG_MISSING_CUST_PARTS, debug_output)
-    logger.info("Missing customer parts file created")
-except Exception as e:
-    logger.error(f"Error building missing customer parts file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build missing customer parts - {e}")
-
-t_customer_parts_file_end = time.time() - t_customer_parts_file_start
-
-#-------------------------------------------------------------------#
-#           Build missing customer parts designator file
-#-------------------------------------------------------------------#
-t_customer_parts_designator_file_start = time.time()
-
-try:
-    logger.info("Building customer parts designator file...")
-    missing_cust_parts_designator_file(master_bom_df, LOG_CUSTOMER_DESIGNATORS, debug_output)
-    logger.info("Customer parts designator file created")
-except Exception as e:
-    logger.error(f"Error building customer parts designator file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build customer parts designator - {e}")
-
-t_customer_parts_designator_file_end = time.time() - t_customer_parts_designator_file_start
-
-#-------------------------------------------------------------------#
-#                      Build missing PCB file
-#-------------------------------------------------------------------#
-t_pcb_file_start = time.time()
-
-try:
-    logger.info("Building PCB status file...")
-    missing_pcb_file(master_bom_df, LOG_PCB_STATUS, debug_output)
-    logger.info("PCB status file created")
-except Exception as e:
-    logger.error(f"Error building PCB status file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build PCB status - {e}")
-
-t_pcb_file_end = time.time() - t_pcb_file_start
-
-#-------------------------------------------------------------------#
-#                    Build missing stencil file
-#-------------------------------------------------------------------#
-t_stencil_file_start = time.time()
-
-try:
-    logger.info("Building stencil status file...")
-    missing_stencil_file(master_bom_df, LOG_STENCIL_STATUS, debug_output)
-    logger.info("Stencil status file created")
-except Exception as e:
-    logger.error(f"Error building stencil status file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build stencil status - {e}")
-
-t_stencil_file_end = time.time() - t_stencil_file_start
-
-#-------------------------------------------------------------------#
-#                       Build parts PO file
-#-------------------------------------------------------------------#
-t_parts_po_file_start = time.time()
-
-try:
-    logger.info("Building PO numbers file...")
-    parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_output)
-    logger.info("PO numbers file created")
-except Exception as e:
-    logger.error(f"Error building PO numbers file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build PO numbers - {e}")
-
-t_parts_po_file_end = time.time() - t_parts_po_file_start
-
-#-------------------------------------------------------------------#
-#                     Refine active jobs list
-#-------------------------------------------------------------------#
-t_refine_active_jobs_start = time.time()
-
-try:
-    logger.info("Refining active jobs list...")
-    refine_active_jobs(
-        LOG_ACTIVE_JOBS,
-        LOG_MISSING_CUST_PARTS,
-        LOG_MISSING_PURCH_PARTS,
-        LOG_PCB_STATUS,
-        LOG_STENCIL_STATUS
-    )
-    logger.info("Active jobs refined successfully")
-except Exception as e:
-    logger.error(f"Error refining active jobs: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to refine active jobs - {e}")
-
-t_refine_active_jobs_end = time.time() - t_refine_active_jobs_start
-
-#-------------------------------------------------------------------#
-#                    Build job statistics file
-#-------------------------------------------------------------------#
-t_stats_file_start = time.time()
-
-try:
-    logger.info("Generating statistics file...")
-    generate_statistics_file(cam_data, active_jobs, credit_hold_jobs)
-    logger.info("Statistics file generated")
-except Exception as e:
-    logger.error(f"Error generating statistics file: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"WARNING: Failed to generate statistics - {e}")
-
-t_stats_file_end = time.time() - t_stats_file_start
-
-#-------------------------------------------------------------------#
-#                Build DataFrame for Smartsheet update
-#-------------------------------------------------------------------#
-t_smartsheet_df_start = time.time()
-
-try:
-    logger.info("Building Smartsheet upload DataFrame...")
-    smartsheet_update_df = build_smartsheet_upload_df(
-                                LOG_ACTIVE_JOBS,
-                                LOG_USER_ENTERED_DATA,
-                                LOG_PO_NUMBERS,
-                                LOG_PURCH_DESIGNATOR,
-                                LOG_CUSTOMER_DESIGNATORS,
-                                LOG_MISSING_PURCH_PARTS,
-                                LOG_MISSING_CUST_PARTS,
-                                LOG_PCB_STATUS,
-                                LOG_STENCIL_STATUS
-    )
-    logger.info(f"Smartsheet DataFrame built with {len(smartsheet_update_df)} rows")
-    
-    if smartsheet_update_df.empty:
-        logger.warning("WARNING: Smartsheet update DataFrame is EMPTY!")
-        print("⚠ WARNING: Nothing to upload to Smartsheet (empty DataFrame)")
-    
+            job_directories = list_job_directories(ASSEMBLY_ACTIVE_DIRECTORY)
+            logger.debug(f"Found {len(job_directories)} directories in network directory")
+        except PermissionError as pe:
+            logger.error(f"Permission denied accessing network directory: {pe}")
+            raise
+
+        # Load assembly job tracking data from camReadme.txt files
+        # (load_assembly_job_data reads the existing cam data log itself to reuse unchanged records)
+        logger.info("Scanning camReadme.txt files...")
+        with timed('cam_data.scan', timings):
+            assembly_job_tracking_df = load_assembly_job_data(ASSEMBLY_ACTIVE_DIRECTORY, LOG_CAM_DATA, job_directories)
+
+        logger.info(f"Loaded {len(assembly_job_tracking_df)} job records from camReadme files")
+
+        if assembly_job_tracking_df.empty:
+            logger.warning("WARNING: No job data found in camReadme.txt files!")
+            print("⚠ WARNING: No assembly jobs found. Check if network directory has job folders.")
+
+        # Sanitize data - fix invalid numeric and date fields
+        logger.info("Sanitizing data fields...")
+        with timed('cam_data.sanitize', timings):
+            assembly_job_tracking_df, data_corrections = sanitize_cam_data(assembly_job_tracking_df)
+
+        if data_corrections:
+            # Save corrections report
+            corrections_file = os.path.join(SCRIPT_DIR, 'SaveFiles', 'data_corrections.json')
+            try:
+                with open(corrections_file, 'w') as f:
+                    json.dump(data_corrections, f, indent=2)
+                logger.info(f"Data corrections report saved to {corrections_file}")
+            except Exception as e:
+                logger.warning(f"Could not save corrections report: {e}")
+
+        # Add 'internal_status' column, blank for all rows (categorical from the start)
+        assembly_job_tracking_df['internal_status'] = pd.Categorical([""] * len(assembly_job_tracking_df), categories=[""])
+
+        # Store low-cardinality text columns as categories
+        for col in CATEGORICAL_CAM_FIELDS:
+            if col in assembly_job_tracking_df.columns:
+                assembly_job_tracking_df[col] = assembly_job_tracking_df[col].astype('category')
+
+        # Store integer columns in the narrowest integer dtype
+        assembly_job_tracking_df = downcast_integer_columns(assembly_job_tracking_df)
+
+        # Keep numeric columns C-contiguous so later merges/groupbys don't run on strided views
+        assembly_job_tracking_df = ensure_c_contiguous(assembly_job_tracking_df)
+
+        # Save updated data back to JSON file
+        if save_cam_data(assembly_job_tracking_df, LOG_CAM_DATA):
+            logger.info(f"Saved cam data to {LOG_CAM_DATA}")
+
+    except FileNotFoundError as e:
+        logger.error(f"File/Directory not found: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Cannot access required files/directories - {e}")
+        print(f"Please verify network connection and directory paths.")
+        sys.exit(1)
+    except PermissionError as e:
+        logger.error(f"Permission denied: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Permission denied accessing network directory - {e}")
+        print(f"Please check your network permissions.")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Error loading assembly job tracking data: {e}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to load assembly job data - {e}")
+        # Initialize empty DataFrame to allow script to continue
+        assembly_job_tracking_df = pd.DataFrame()
+        assembly_job_tracking_df['internal_status'] = ""
+
+    return assembly_job_tracking_df, job_directories
+
+
+def fetch_smartsheet(smartsheet_executor, smartsheet_future, timings):
+    """
+    Waits for the background Smartsheet download and converts the sheet to a DataFrame.
+
+    Args:
+        smartsheet_executor (ThreadPoolExecutor): Executor running the download
+        smartsheet_future (Future): Future returned by start_smartsheet_download()
+        timings (dict): Per-stage timings (ns) - sub-stage timings are added to it
+
+    Returns:
+        tuple: (smartsheet_sheet, smartsheet_part_tracking_df)
+    """
+    try:
+        with timed('smartsheet.wait_for_download', timings):
+            smartsheet_sheet = smartsheet_future.result()
+        smartsheet_executor.shutdown()
+
+        logger.info(f"Smartsheet retrieved - Rows: {len(smartsheet_sheet.rows)}, Columns: {len(smartsheet_sheet.columns)}")
+        with timed('smartsheet.convert', timings):
+            smartsheet_part_tracking_df = convert_sheet_to_dataframe(smartsheet_sheet)
+        logger.info(f"Smartsheet converted to DataFrame - Shape: {smartsheet_part_tracking_df.shape}")
+
+        # Keep numeric columns C-contiguous so later merges/groupbys don't run on strided views
+        smartsheet_part_tracking_df = ensure_c_contiguous(smartsheet_part_tracking_df)
+
+        # Sample rows are only formatted when they will actually be shown or logged
+        if debug_output:
+            print("Smartsheet DataFrame columns:", smartsheet_part_tracking_df.columns.tolist())
+            print("First few rows of Smartsheet DataFrame:")
+            print(smartsheet_part_tracking_df.head())
+            if '_row_id' in smartsheet_part_tracking_df.columns:
+                print("_row_id sample:", smartsheet_part_tracking_df['_row_id'].head().tolist())
+        elif DEBUG and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Smartsheet DataFrame columns: {smartsheet_part_tracking_df.columns.tolist()}")
+            logger.debug(f"First few rows of Smartsheet DataFrame:\n{smartsheet_part_tracking_df.head()}")
+            if '_row_id' in smartsheet_part_tracking_df.columns:
+                logger.debug(f"_row_id sample: {smartsheet_part_tracking_df['_row_id'].head().tolist()}")
+
+        if smartsheet_part_tracking_df.empty:
+            logger.warning("WARNING: Smartsheet DataFrame is EMPTY! This might be expected if starting fresh.")
+            print("⚠ WARNING: Smartsheet is empty. Continuing with empty DataFrame...")
+
+    except smartsheet.exceptions.ApiError as e:
+        logger.error(f"Smartsheet API error: {e}")
+        logger.error(f"Error code: {e.error.result.error_code if hasattr(e.error, 'result') else 'Unknown'}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Smartsheet API error - {e}")
+        print(f"This could be due to: invalid token, no network access, or incorrect sheet ID")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error converting Smartsheet data: {e}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to load Smartsheet - {e}")
+        sys.exit(1)
+
+    return smartsheet_sheet, smartsheet_part_tracking_df
+
+
+def main():
+    """Runs the full assembly order tracker update"""
+    setup_logging()
+
+    # Track script start time and per-stage timings (ns, from perf_counter_ns) for performance/debug
+    script_start = time.perf_counter_ns()
+    timings = {}
+    logger.info(f"{'='*70}")
+    logger.info(f"Script started - DEBUG Mode: {DEBUG}")
+    logger.info(f"{'='*70}")
+    print(f"Script started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     if DEBUG:
-        logger.debug(f"Smartsheet update columns: {smartsheet_update_df.columns.tolist()}")
-        logger.debug(f"Sample data:\n{smartsheet_update_df.head()}")
-
-except Exception as e:
-    logger.error(f"Error building Smartsheet update DataFrame: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to build Smartsheet DataFrame - {e}")
-    smartsheet_update_df = pd.DataFrame()
-
-t_smartsheet_df_end = time.time() - t_smartsheet_df_start
-
-#-------------------------------------------------------------------#
-#                         Update smartsheet
-#-------------------------------------------------------------------#
-t_smartsheet_update_start = time.time()
-
-try:
-    logger.info("Updating Smartsheet...")
-    if smartsheet_update_df.empty:
-        logger.warning("Skipping Smartsheet update - no data to upload")
-        print("⚠ Skipping Smartsheet update (no data)")
-    else:
-        update_smartsheet(
-            smartsheet_update_df,
-            smartsheet_client,
-            assembly_part_tracking_id,
-            smartsheet_part_tracking_df,
-            smartsheet_sheet
+        print(f"DEBUG MODE ENABLED - Detailed logs will be written to {DEBUG_LOG_PATH}")
+    print(f"Error logs will be written to {ERROR_LOG_PATH}")
+
+    #-------------------------------------------------------------------#
+    #        Connect to smartsheet and start the sheet download
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+    smartsheet_client, smartsheet_executor, smartsheet_future = start_smartsheet_download()
+
+    timings['smartsheet'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #          Get camData (ETHAR) and convert to dataframe
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+    assembly_job_tracking_df, job_directories = load_camdata(timings)
+
+    timings['cam_data'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #            Get smartsheet and convert to dataframe
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+    smartsheet_sheet, smartsheet_part_tracking_df = fetch_smartsheet(smartsheet_executor, smartsheet_future, timings)
+
+    timings['smartsheet'] += time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #            Store smartsheet user entered infomration 
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+    user_entered_data = None
+
+    try:
+        logger.info("Storing Smartsheet user-entered data...")
+        user_entered_data = store_smartsheet_user_data(smartsheet_part_tracking_df, USE_COLOR_PROGRESS_BAR)
+        logger.info("User-entered data stored successfully")
+    except Exception as e:
+        logger.error(f"Error storing Smartsheet user data: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to store user-entered data - {e}")
+
+    timings['store_user_data'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #         Build active assembly jobs and credit hold files
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building active assembly jobs and credit hold files...")
+        # Use the camData records already in memory (only re-read the saved log if loading failed)
+        if not assembly_job_tracking_df.empty:
+            cam_data = cam_data_to_records(assembly_job_tracking_df)
+        else:
+            cam_data = load_cam_data(LOG_CAM_DATA)
+        logger.debug(f"Loaded {len(cam_data)} records from cam data")
+
+        # Load existing credit hold data to check for releases
+        existing_credit_holds = set()
+
+        existing_data = load_json_file(LOG_CREDIT_HOLD, default_value=[])
+
+        if existing_data:
+            # Extract WO# from existing credit hold records (one lookup per record)
+            existing_credit_holds = {wo_number for wo_number in (record.get('WO#') for record in existing_data) if wo_number}
+            logger.debug(f"Found {len(existing_credit_holds)} existing credit holds")
+
+        active_jobs, credit_hold_jobs, credit_hold_released = build_active_credithold_files(cam_data, existing_credit_holds)
+        logger.info(f"Built active jobs: {len(active_jobs)}, credit holds: {len(credit_hold_jobs)}, released: {len(credit_hold_released)}")
+
+        # Write active jobs to log_active_jobs.json
+        if save_json_file(active_jobs, LOG_ACTIVE_JOBS, create_dir=True):
+            logger.info(f"Active jobs saved successfully: {len(active_jobs)} records")
+            print(f"✓ Active jobs saved successfully: {len(active_jobs)} records")
+
+        # Write credit hold jobs to log_credit_hold.json
+        if save_json_file(credit_hold_jobs, LOG_CREDIT_HOLD, create_dir=True):
+            logger.info(f"Credit hold jobs saved successfully: {len(credit_hold_jobs)} records")
+            print(f"✓ Credit hold jobs saved successfully: {len(credit_hold_jobs)} records")
+
+        # Write credit hold jobs to log_credit_released.json
+        if save_json_file(credit_hold_released, LOG_CREDIT_RELEASED, create_dir=True):
+            logger.info(f"Credit hold released jobs saved successfully: {len(credit_hold_released)} records")
+            print(f"✓ Credit hold released jobs saved successfully: {len(credit_hold_released)} records")
+
+    except Exception as e:
+        logger.error(f"Error building active assembly jobs file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build active jobs - {e}")
+        # Initialize variables to prevent NameError in subsequent code
+        active_jobs = []
+        credit_hold_jobs = []
+        credit_hold_released = []
+        cam_data = []
+
+    timings['active_jobs'] = time.perf_counter_ns() - t_stage_start
+
+    # The camData DataFrame is no longer needed (cam_data holds the records), release it before the BOM is built
+    del assembly_job_tracking_df
+
+    #-------------------------------------------------------------------#
+    #                    Build master BOM dataframe
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building master BOM dataframe...")
+        master_bom_df = build_master_bom(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, debug_output, job_directories)
+        logger.info(f"Master BOM built with {len(master_bom_df)} records")
+        if master_bom_df.empty:
+            logger.warning("WARNING: Master BOM is empty!")
+            print("⚠ WARNING: Master BOM is empty. Check if job folders contain BOM files.")
+    except Exception as e:
+        logger.error(f"Error building master BOM dataframe: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build master BOM - {e}")
+        master_bom_df = pd.DataFrame()
+
+    timings['master_bom'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                Add overage to master parts file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+    bom_derivatives = None
+
+    try:
+        logger.info("Adding purchasing overage to master BOM...")
+        master_bom_df = add_overage_to_master_bom(master_bom_df, QUOTE_DIR, False)
+        logger.info("Overage added successfully")
+
+        # Categorical fields and numeric quantities shared by the missing parts/status files below
+        master_bom_df = prepare_master_bom(master_bom_df)
+
+        # Data for all missing parts/status files below, built in one pass over the master BOM
+        bom_derivatives = build_bom_derivatives(master_bom_df)
+    except Exception as e:
+        logger.error(f"Error adding purchasing overage to master BOM: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to add overage - {e}")
+
+    timings['overage'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                Build missing purchase parts file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building missing purchase parts file...")
+        missing_purchase_parts_file(master_bom_df, LOG_MISSING_PURCH_PARTS, debug_output, bom_derivatives)
+        logger.info("Missing purchase parts file created")
+    except Exception as e:
+        logger.error(f"Error building missing purchase parts file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build missing purchase parts - {e}")
+
+    timings['missing_purchase_parts'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #           Build missing purchase parts designator file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building purchase parts designator file...")
+        missing_purchase_parts_designator_file(master_bom_df, LOG_PURCH_DESIGNATOR, debug_output, bom_derivatives)
+        logger.info("Purchase parts designator file created")
+    except Exception as e:
+        logger.error(f"Error building purchase parts designator file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build purchase parts designator - {e}")
+
+    timings['purchase_designators'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                Build missing customer parts file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building missing customer parts file...")
+        missing_cust_parts_file(master_bom_df, LOG_MISSING_CUST_PARTS, debug_output, bom_derivatives)
+        logger.info("Missing customer parts file created")
+    except Exception as e:
+        logger.error(f"Error building missing customer parts file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build missing customer parts - {e}")
+
+    timings['missing_customer_parts'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #           Build missing customer parts designator file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building customer parts designator file...")
+        missing_cust_parts_designator_file(master_bom_df, LOG_CUSTOMER_DESIGNATORS, debug_output, bom_derivatives)
+        logger.info("Customer parts designator file created")
+    except Exception as e:
+        logger.error(f"Error building customer parts designator file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build customer parts designator - {e}")
+
+    timings['customer_designators'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                      Build missing PCB file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building PCB status file...")
+        missing_pcb_file(master_bom_df, LOG_PCB_STATUS, debug_output, bom_derivatives)
+        logger.info("PCB status file created")
+    except Exception as e:
+        logger.error(f"Error building PCB status file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build PCB status - {e}")
+
+    timings['pcb_status'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                    Build missing stencil file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building stencil status file...")
+        missing_stencil_file(master_bom_df, LOG_STENCIL_STATUS, debug_output, bom_derivatives)
+        logger.info("Stencil status file created")
+    except Exception as e:
+        logger.error(f"Error building stencil status file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build stencil status - {e}")
+
+    timings['stencil_status'] = time.perf_counter_ns() - t_stage_start
+
+    # The master BOM is no longer needed (later stages use bom_derivatives), release it to lower peak memory
+    del master_bom_df
+
+    #-------------------------------------------------------------------#
+    #                       Build parts PO file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+    po_numbers_data = None
+
+    try:
+        logger.info("Building PO numbers file...")
+        po_numbers_data = parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_output, job_directories)
+        logger.info("PO numbers file created")
+    except Exception as e:
+        logger.error(f"Error building PO numbers file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build PO numbers - {e}")
+
+    timings['parts_po'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                     Refine active jobs list
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+    wo_lookups = None
+    refined_active_jobs = None
+
+    try:
+        logger.info("Refining active jobs list...")
+        # Missing parts/status lookups are built once and reused for the Smartsheet DataFrame,
+        # from the BOM data already in memory (the log files are only read if that failed)
+        if bom_derivatives:
+            wo_lookups = build_wo_status_lookups(
+                bom_derivatives['missing_cust'],
+                bom_derivatives['missing_purch'],
+                bom_derivatives['pcb'],
+                bom_derivatives['stencil']
+            )
+        else:
+            wo_lookups = load_wo_status_lookups(
+                LOG_MISSING_CUST_PARTS,
+                LOG_MISSING_PURCH_PARTS,
+                LOG_PCB_STATUS,
+                LOG_STENCIL_STATUS
+            )
+        refined_active_jobs = refine_active_jobs(
+            LOG_ACTIVE_JOBS,
+            LOG_MISSING_CUST_PARTS,
+            LOG_MISSING_PURCH_PARTS,
+            LOG_PCB_STATUS,
+            LOG_STENCIL_STATUS,
+            wo_lookups
         )
-        logger.info("Smartsheet update completed successfully")
-        print("✓ Smartsheet updated successfully")
-
-except smartsheet.exceptions.ApiError as e:
-    logger.error(f"Smartsheet API error during update: {e}")
-    logger.error(f"Error code: {e.error.result.error_code if hasattr(e.error, 'result') else 'Unknown'}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Smartsheet API error during update - {e}")
-    print(f"Data may not have been uploaded correctly. Check the error log.")
-except Exception as e:
-    logger.error(f"Error updating Smartsheet: {e}")
-    logger.error(f"Error type: {type(e).__name__}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
-    print(f"ERROR: Failed to update Smartsheet - {e}")
-
-t_smartsheet_update_end = time.time() - t_smartsheet_update_start
-
-#-------------------------------------------------------------------#
-#                         Print timing data
-#-------------------------------------------------------------------#
-script_end = time.time()
-
-logger.info(f"{'='*70}")
-logger.info("Script execution summary:")
-logger.info(f"Loaded assembly job tracker (smartsheet): {t_convert_end:.2f} seconds")
-logger.info(f"Stored smartsheet user data: {t_smartsheet_data_end:.2f} seconds")
-logger.info(f"Loaded assembly job tracking data (camReadme.txt): {t_camData_end:.2f} seconds")
-logger.info(f"Built active assembly jobs file: {t_active_jobs_file_time:.2f} seconds")
-logger.info(f"Built master BOM dataframe: {t_master_BOM_end:.2f} seconds")
-logger.info(f"Total script runtime: {script_end - script_start:.2f} seconds")
-logger.info(f"{'='*70}")
-
-print(f"Loaded assembly job tracker (smartsheet): {t_convert_end:.2f} seconds")
-print(f"Stored smartsheet user data: {t_smartsheet_data_end:.2f} seconds")
-print(f"Loaded assembly job tracking data (camReadme.txt): {t_camData_end:.2f} seconds")
-print(f"Built active assembly jobs file: {t_active_jobs_file_time:.2f} seconds")
-print(f"Built master BOM dataframe: {t_master_BOM_end:.2f} seconds")
-print(f"Added overage to master BOM: {t_reqd_parts_file_end:.2f} seconds")
-print(f"Built missing purchase parts file: {t_purchase_parts_file_end:.2f} seconds")
-print(f"Built missing purchase parts designator file: {t_purchase_parts_designator_file_end:.2f} seconds")
-print(f"Built missing customer parts file: {t_customer_parts_file_end:.2f} seconds")
-print(f"Built missing customer parts designator file: {t_customer_parts_designator_file_end:.2f} seconds")
-print(f"Built PCB status file: {t_pcb_file_end:.2f} seconds")
-print(f"Built stencil status file: {t_stencil_file_end:.2f} seconds")
-print(f"Built parts PO file: {t_parts_po_file_end:.2f} seconds")
-print(f"Built job statistics file: {t_stats_file_end:.2f} seconds")
-print(" ")
-print(f"Script ended at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-print(f"Total script runtime: {script_end - script_start:.2f} seconds")
-print(f"✓ Processing complete!")
-print(f"\nLogs written to: {ERROR_LOG_PATH}")
-if DEBUG:
-    print(f"Debug logs written to: {DEBUG_LOG_PATH}")
\ No newline at end of file
+        logger.info("Active jobs refined successfully")
+    except Exception as e:
+        logger.error(f"Error refining active jobs: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to refine active jobs - {e}")
+
+    timings['refine_active_jobs'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                    Build job statistics file
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Generating statistics file...")
+        generate_statistics_file(cam_data, active_jobs, credit_hold_jobs)
+        logger.info("Statistics file generated")
+    except Exception as e:
+        logger.error(f"Error generating statistics file: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"WARNING: Failed to generate statistics - {e}")
+
+    timings['statistics'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                Build DataFrame for Smartsheet update
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Building Smartsheet upload DataFrame...")
+        smartsheet_update_df = build_smartsheet_upload_df(
+                                    LOG_ACTIVE_JOBS,
+                                    LOG_USER_ENTERED_DATA,
+                                    LOG_PO_NUMBERS,
+                                    LOG_PURCH_DESIGNATOR,
+                                    LOG_CUSTOMER_DESIGNATORS,
+                                    LOG_MISSING_PURCH_PARTS,
+                                    LOG_MISSING_CUST_PARTS,
+                                    LOG_PCB_STATUS,
+                                    LOG_STENCIL_STATUS,
+                                    refined_active_jobs,
+                                    wo_lookups,
+                                    user_entered_data,
+                                    po_numbers_data,
+                                    bom_derivatives['purch_des'] if bom_derivatives else None,
+                                    bom_derivatives['cust_des'] if bom_derivatives else None
+        )
+        logger.info(f"Smartsheet DataFrame built with {len(smartsheet_update_df)} rows")
+
+        if smartsheet_update_df.empty:
+            logger.warning("WARNING: Smartsheet update DataFrame is EMPTY!")
+            print("⚠ WARNING: Nothing to upload to Smartsheet (empty DataFrame)")
+
+        if DEBUG and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Smartsheet update columns: {smartsheet_update_df.columns.tolist()}")
+            logger.debug(f"Sample data:\n{smartsheet_update_df.head()}")
+
+    except Exception as e:
+        logger.error(f"Error building Smartsheet update DataFrame: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to build Smartsheet DataFrame - {e}")
+        smartsheet_update_df = pd.DataFrame()
+
+    timings['upload_df'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                         Update smartsheet
+    #-------------------------------------------------------------------#
+    t_stage_start = time.perf_counter_ns()
+
+    try:
+        logger.info("Updating Smartsheet...")
+        if smartsheet_update_df.empty:
+            logger.warning("Skipping Smartsheet update - no data to upload")
+            print("⚠ Skipping Smartsheet update (no data)")
+        else:
+            update_smartsheet(
+                smartsheet_update_df,
+                smartsheet_client,
+                assembly_part_tracking_id,
+                smartsheet_part_tracking_df,
+                smartsheet_sheet
+            )
+            logger.info("Smartsheet update completed successfully")
+            print("✓ Smartsheet updated successfully")
+
+    except smartsheet.exceptions.ApiError as e:
+        logger.error(f"Smartsheet API error during update: {e}")
+        logger.error(f"Error code: {e.error.result.error_code if hasattr(e.error, 'result') else 'Unknown'}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Smartsheet API error during update - {e}")
+        print(f"Data may not have been uploaded correctly. Check the error log.")
+    except Exception as e:
+        logger.error(f"Error updating Smartsheet: {e}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        print(f"ERROR: Failed to update Smartsheet - {e}")
+
+    timings['smartsheet_update'] = time.perf_counter_ns() - t_stage_start
+
+    #-------------------------------------------------------------------#
+    #                         Print timing data
+    #-------------------------------------------------------------------#
+    timings['total'] = time.perf_counter_ns() - script_start
+
+    def stage_seconds(name):
+        """Returns the recorded time for a stage in seconds (0 if the stage did not run)"""
+        return timings.get(name, 0) / 1e9
+
+    stage_labels = [
+        ('smartsheet', "Loaded assembly job tracker (smartsheet)"),
+        ('store_user_data', "Stored smartsheet user data"),
+        ('cam_data', "Loaded assembly job tracking data (camReadme.txt)"),
+        ('active_jobs', "Built active assembly jobs file"),
+        ('master_bom', "Built master BOM dataframe"),
+        ('overage', "Added overage to master BOM"),
+        ('missing_purchase_parts', "Built missing purchase parts file"),
+        ('purchase_designators', "Built missing purchase parts designator file"),
+        ('missing_customer_parts', "Built missing customer parts file"),
+        ('customer_designators', "Built missing customer parts designator file"),
+        ('pcb_status', "Built PCB status file"),
+        ('stencil_status', "Built stencil status file"),
+        ('parts_po', "Built parts PO file"),
+        ('statistics', "Built job statistics file"),
+    ]
+    timing_summary = "\n".join(f"{label}: {stage_seconds(name):.2f} seconds" for name, label in stage_labels)
+
+    logger.info(
+        f"{'='*70}\nScript execution summary:\n{timing_summary}\n"
+        f"Total script runtime: {stage_seconds('total'):.2f} seconds\n"
+        f"Stage timings (ns): {json.dumps(timings)}\n{'='*70}"
+    )
+
+    print(timing_summary)
+    print(" ")
+    print(f"Script ended at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Total script runtime: {stage_seconds('total'):.2f} seconds")
+    if DEBUG or debug_output:
+        print(f"Stage timings (ns): {json.dumps(timings)}")
+    print(f"✓ Processing complete!")
+    print(f"\nLogs written to: {ERROR_LOG_PATH}")
+    if DEBUG:
+        print(f"Debug logs written to: {DEBUG_LOG_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -42,16 +42,18 @@ smartsheet_headers = [
     "Purchase Order", "Purch Des", "Cust Des", "Additional Notes", "Refresh Date", "Refresh Time"
 ]
 
-DELETE_BATCH_SIZE = 100
-ADD_BATCH_SIZE = 100
+DELETE_BATCH_SIZE = 400  # Row IDs per delete_rows request (Smartsheet accepts up to ~450 per call)
+ADD_BATCH_SIZE = 400  # Rows per add_rows request (Smartsheet accepts up to 500 per call)
+SMARTSHEET_MAX_CONNECTIONS = 16  # HTTP connection pool size of the shared Smartsheet client
+SMARTSHEET_MAX_RETRY_TIME = 120  # Seconds the SDK keeps retrying rate-limited (4003) requests with exponential backoff
+SMARTSHEET_MAX_ROWS_PER_REQUEST = 500  # Hard Smartsheet limit on rows per add/delete request (batch sizes are capped to it)
+SMARTSHEET_MAX_ATTEMPTS = 4  # Attempts per add/delete batch when Smartsheet still answers 429/503 after the SDK's own retries
 
 # Progress bar settings
 USE_COLOR_PROGRESS_BAR = True  # Set to False for basic ASCII progress bar without colors
 
 bar_len = 100 # Progress bar length
-
-delete_batch_size = 240  # Delete smartsheet batch size
-insert_batch_size = 450  # Insert smartsheet batch size
+PROGRESS_BAR_MIN_INTERVAL = 0.1  # Seconds between progress bar redraws when the percentage has not changed
 
 color_options = [
             (139, 0, 0),    # Dark Red
@@ -82,4 +84,19 @@ DATE_FIELDS = [
 
 # Default values for invalid data
 DEFAULT_NUMERIC_VALUE = 0
-DEFAULT_DATE_VALUE = '1980-01-01'
\ No newline at end of file
+DEFAULT_DATE_VALUE = '1980-01-01'
+
+# Low-cardinality camData fields stored as pandas categories (less memory, faster grouping)
+CATEGORICAL_CAM_FIELDS = [
+    'Status', 'Credit Hold', 'internal_status', 'Customer'
+]
+# Low-cardinality master BOM fields stored as pandas categories (faster isin/== filters)
+CATEGORICAL_BOM_FIELDS = [
+    'WO#', 'MPN', 'Part_Number', 'Cust_Supplied'
+]
+# Number of threads used to read job folder files from the network directory
+FILE_SCAN_WORKERS = 16
+
+# Fast IO configuration
+# Store the camData cache as Parquet next to log_camData.json (requires pyarrow, falls back to JSON if unavailable)
+FAST_IO = True
@@ -4,6 +4,10 @@ import pandas as pd
 import os
 import sys
 import json
+import bisect
+import hashlib
+import re
+import stat
 from datetime import datetime
 from dateutil import parser
 import random
@@ -11,6 +15,27 @@ import numpy as np
 import smartsheet
 import logging
 import traceback
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
 
 from defines import *
 from local_secrets import PASSWORD_FILE_PATH, ENCRYPTED_KEY_PATH, SQL_PASSWORD_PATH, SQL_PASSWORD_KEY_PATH
@@ -18,10 +43,122 @@ from local_secrets import PASSWORD_FILE_PATH, ENCRYPTED_KEY_PATH, SQL_PASSWORD_P
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# save_json_file() output options: 2-space indent like json.dump(indent=2), non-string keys converted
+# to strings, and datetimes/dataclasses passed to _json_default() so they are written as str() like before
+if orjson is not None:
+    ORJSON_SAVE_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                           orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+# camReadme.txt field lines: 'key|value' (key is everything before the first '|' on the line)
+_CAMREADME_FIELD_RE = re.compile(r'^([^|\n]*)\|([^\n]*)$', re.MULTILINE)
+
+# R4_RECEIVING_BOM PO number: first '|' separated value of a line when it is an integer as accepted by int()
+# (optional sign, digits with single '_' separators, surrounding whitespace but no line break)
+_RECEIVING_BOM_PO_RE = re.compile(r'^[^\S\n]*([+-]?\d+(?:_\d+)*)[^\S\n]*\|', re.MULTILINE)
+# Same pattern for ASCII file bytes: a line starts after '\n' or '\r' (the line endings text mode translates)
+_RECEIVING_BOM_PO_BYTES_RE = re.compile(rb'(?:^|(?<=\r))[ \t\f\v\x1c-\x1f]*([+-]?\d+(?:_\d+)*)[ \t\f\v\x1c-\x1f]*\|',
+                                        re.MULTILINE)
+
+# First designator of a designator list, one alternative per extract_first_designator rule in priority order:
+# text before the first ',', before the first ';', before the first '-' when that text contains a letter
+# (range like "C1-C70"), before the first ' ', otherwise the whole string. Exactly one group participates.
+# A "letter" is a word character other than a digit or '_' (same as str.isalpha() except for numeric
+# symbols such as '²' or 'Ⅻ', which do not occur in reference designators).
+_FIRST_DES_RE = re.compile(r'^(?:([^,]*),|([^;]*);|([^-]*[^\W\d_][^-]*)-|([^ ]*) |(.*))', re.DOTALL)
+
 def get_save_path(filename):
     """Helper function to get absolute path for SaveFiles directory"""
     return os.path.join(SCRIPT_DIR, 'SaveFiles', filename)
 
+def _to_numeric_value(value):
+    """Converts a single camData value to a number with pd.to_numeric (raises if it is not numeric)"""
+    return pd.to_numeric(value, errors='raise')
+
+def _check_date_value(value):
+    """Returns a single camData value unchanged if pd.to_datetime can parse it (raises otherwise)"""
+    pd.to_datetime(value, errors='raise')
+    return value
+
+def _sanitize_cam_field(df: pd.DataFrame, field: str, convert, skip_types: tuple, correction_type: str,
+                        default_value, corrections: list) -> None:
+    """
+    Validates one camData column in place for sanitize_cam_data(). Empty values (None/NaN/'') and
+    values of skip_types are left alone, every other value is passed to convert() and replaced by
+    its result, or by default_value (recorded in corrections) if convert() raises. convert() runs
+    once per distinct value, so repeated entries are not parsed again.
+
+    Args:
+        df (pd.DataFrame): camData DataFrame (modified in place)
+        field (str): Column to validate
+        convert (callable): Returns the value to store for a valid value, raises ValueError/TypeError otherwise
+        skip_types (tuple): Value types that are kept without conversion
+        correction_type (str): 'Numeric' or 'Date', used in the correction records and log messages
+        default_value: Value stored in place of invalid entries
+        corrections (list): List the correction records are appended to
+    """
+    column = df[field]
+    values = column.to_numpy(dtype=object, copy=True)
+    to_check = ~(column.isna().to_numpy() | column.eq('').to_numpy(dtype=bool))
+    wo_values = df['WO#'].to_numpy() if 'WO#' in df.columns else None
+    customer_values = df['Customer'].to_numpy() if 'Customer' in df.columns else None
+
+    converted_by_value = {}
+    changed = False
+    for position in np.flatnonzero(to_check):
+        original_value = values[position]
+        if isinstance(original_value, skip_types):
+            continue
+
+        # Typed key so equal values of different types (e.g. numpy scalars) are converted separately
+        key = (type(original_value), original_value)
+        try:
+            result = converted_by_value.get(key)
+        except TypeError:  # unhashable value, convert it without caching
+            key = None
+            result = None
+        if result is None:
+            try:
+                converted_value = convert(original_value)
+                # (valid, value to store, whether the value is kept as it is)
+                result = (True, converted_value, converted_value is original_value)
+            except (ValueError, TypeError, parser.ParserError):
+                result = (False, None, False)
+            if key is not None:
+                converted_by_value[key] = result
+
+        is_valid, converted_value, is_unchanged = result
+        if is_valid:
+            if not is_unchanged:
+                values[position] = converted_value
+                changed = True
+            continue
+
+        # Invalid value - set to default
+        idx = df.index[position]
+        wo_number = wo_values[position] if wo_values is not None else 'Unknown'
+        customer = customer_values[position] if customer_values is not None else 'Unknown'
+
+        corrections.append({
+            'Record': idx,
+            'WO#': wo_number,
+            'Customer': customer,
+            'Field': field,
+            'Original_Value': str(original_value),
+            'Corrected_Value': default_value,
+            'Type': correction_type
+        })
+
+        values[position] = default_value
+        changed = True
+
+        logger.warning(
+            f"Corrected {correction_type.lower()} field: Record {idx} | WO# {wo_number} | "
+            f"Field '{field}': '{original_value}' → {default_value}"
+        )
+
+    if changed:
+        df[field] = values
+
 def sanitize_cam_data(df: pd.DataFrame) -> tuple:
     """
     Sanitizes camReadme data by validating and correcting field types.
@@ -44,123 +181,50 @@ def sanitize_cam_data(df: pd.DataFrame) -> tuple:
     # Sanitize missing WO# fields with unique placeholder values
     missing_wo_counter = 1
     if 'WO#' in df.columns:
-        for idx in df.index:
-            wo_value = df.at[idx, 'WO#']
-            if wo_value is None or (isinstance(wo_value, str) and wo_value.strip() == '') or pd.isna(wo_value):
-                # Generate unique placeholder WO#
-                placeholder_wo = f"99999_{missing_wo_counter:02d}"
-                customer = df.at[idx, 'Customer'] if 'Customer' in df.columns else 'Unknown'
-                
-                correction = {
-                    'Record': idx,
-                    'WO#': placeholder_wo,
-                    'Customer': customer,
-                    'Field': 'WO#',
-                    'Original_Value': 'MISSING',
-                    'Corrected_Value': placeholder_wo,
-                    'Type': 'Missing Field'
-                }
-                corrections.append(correction)
-                
-                df.at[idx, 'WO#'] = placeholder_wo
-                missing_wo_counter += 1
-                
-                logger.warning(
-                    f"Corrected missing WO#: Record {idx} | Customer {customer} | "
-                    f"Set to '{placeholder_wo}'"
-                )
+        wo_column = df['WO#']
+        missing_wo = wo_column.isna().to_numpy() | np.fromiter(
+            (isinstance(wo_value, str) and wo_value.strip() == '' for wo_value in wo_column.to_numpy(dtype=object)),
+            dtype=bool, count=len(wo_column)
+        )
+        # Only the rows missing a WO# (None, NaN or blank) are visited
+        for idx in df.index[missing_wo]:
+            # Generate unique placeholder WO#
+            placeholder_wo = f"99999_{missing_wo_counter:02d}"
+            customer = df.at[idx, 'Customer'] if 'Customer' in df.columns else 'Unknown'
+            
+            correction = {
+                'Record': idx,
+                'WO#': placeholder_wo,
+                'Customer': customer,
+                'Field': 'WO#',
+                'Original_Value': 'MISSING',
+                'Corrected_Value': placeholder_wo,
+                'Type': 'Missing Field'
+            }
+            corrections.append(correction)
+            
+            df.at[idx, 'WO#'] = placeholder_wo
+            missing_wo_counter += 1
+            
+            logger.warning(
+                f"Corrected missing WO#: Record {idx} | Customer {customer} | "
+                f"Set to '{placeholder_wo}'"
+            )
         
         if missing_wo_counter > 1:
             total_missing = missing_wo_counter - 1
             logger.warning(f"Replaced {total_missing} missing WO# field(s) with placeholder values (99999_01, etc.)")
             print(f"⚠ WARNING: {total_missing} records had missing WO# - replaced with placeholder values (99999_01, 99999_02, etc.)")
     
-    # Sanitize numeric fields
+    # Sanitize numeric fields (values that are already int/float are kept as they are)
     for field in NUMERIC_FIELDS:
-        if field not in df.columns:
-            continue
-            
-        for idx in df.index:
-            original_value = df.at[idx, field]
-            
-            # Skip if already None/NaN or empty
-            if pd.isna(original_value) or original_value == '':
-                continue
-            
-            # Try to convert to numeric
-            try:
-                # If it's already numeric, skip
-                if isinstance(original_value, (int, float)):
-                    continue
-                    
-                # Try to convert string to numeric
-                numeric_value = pd.to_numeric(original_value, errors='raise')
-                df.at[idx, field] = numeric_value
-                
-            except (ValueError, TypeError):
-                # Invalid numeric value - set to default
-                wo_number = df.at[idx, 'WO#'] if 'WO#' in df.columns else 'Unknown'
-                customer = df.at[idx, 'Customer'] if 'Customer' in df.columns else 'Unknown'
-                
-                correction = {
-                    'Record': idx,
-                    'WO#': wo_number,
-                    'Customer': customer,
-                    'Field': field,
-                    'Original_Value': str(original_value),
-                    'Corrected_Value': DEFAULT_NUMERIC_VALUE,
-                    'Type': 'Numeric'
-                }
-                corrections.append(correction)
-                
-                df.at[idx, field] = DEFAULT_NUMERIC_VALUE
-                
-                logger.warning(
-                    f"Corrected numeric field: Record {idx} | WO# {wo_number} | "
-                    f"Field '{field}': '{original_value}' → {DEFAULT_NUMERIC_VALUE}"
-                )
+        if field in df.columns:
+            _sanitize_cam_field(df, field, _to_numeric_value, (int, float), 'Numeric', DEFAULT_NUMERIC_VALUE, corrections)
     
-    # Sanitize date fields
+    # Sanitize date fields (values that parse as dates are kept as they are)
     for field in DATE_FIELDS:
-        if field not in df.columns:
-            continue
-            
-        for idx in df.index:
-            original_value = df.at[idx, field]
-            
-            # Skip if already None/NaN or empty
-            if pd.isna(original_value) or original_value == '':
-                continue
-            
-            # Try to parse as date
-            try:
-                # Try pandas to_datetime
-                parsed_date = pd.to_datetime(original_value, errors='raise')
-                # If successful, keep the original value
-                continue
-                
-            except (ValueError, TypeError, parser.ParserError):
-                # Invalid date value - set to default
-                wo_number = df.at[idx, 'WO#'] if 'WO#' in df.columns else 'Unknown'
-                customer = df.at[idx, 'Customer'] if 'Customer' in df.columns else 'Unknown'
-                
-                correction = {
-                    'Record': idx,
-                    'WO#': wo_number,
-                    'Customer': customer,
-                    'Field': field,
-                    'Original_Value': str(original_value),
-                    'Corrected_Value': DEFAULT_DATE_VALUE,
-                    'Type': 'Date'
-                }
-                corrections.append(correction)
-                
-                df.at[idx, field] = DEFAULT_DATE_VALUE
-                
-                logger.warning(
-                    f"Corrected date field: Record {idx} | WO# {wo_number} | "
-                    f"Field '{field}': '{original_value}' → {DEFAULT_DATE_VALUE}"
-                )
+        if field in df.columns:
+            _sanitize_cam_field(df, field, _check_date_value, (), 'Date', DEFAULT_DATE_VALUE, corrections)
     
     if corrections:
         logger.warning(f"\n{'='*70}")
@@ -197,6 +261,22 @@ def sanitize_cam_data(df: pd.DataFrame) -> tuple:
     
     return df, corrections
 
+@contextmanager
+def timed(name: str, timings: dict):
+    """
+    Context manager that adds the elapsed time of its block (in ns, from time.perf_counter_ns)
+    to timings[name]. Useful for measuring nested sections inside a stage.
+
+    Args:
+        name (str): Key to record the time under
+        timings (dict): Dictionary of accumulated timings
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0) + time.perf_counter_ns() - start
+
 def safe_float(value, default=0.0):
     """
     Safely convert a value to float, returning default if conversion fails.
@@ -237,6 +317,9 @@ def safe_int(value, default=0):
         logger.debug(f"Could not convert '{value}' to int, using default {default}")
         return default
 
+# Last drawn (total, percent) of the progress bar and when it was drawn
+_progress_bar_state = {'key': None, 'time': 0.0}
+
 def blue_gradient_bar(progress, total, end_color=None, use_color=False):
     """
     Prints a progress bar to the terminal with optional color gradient.
@@ -249,8 +332,19 @@ def blue_gradient_bar(progress, total, end_color=None, use_color=False):
                                    Defaults to True.
     
     Returns:
-        None: Prints progress bar directly to terminal
+        None: Prints progress bar directly to terminal. Redraws are skipped while neither the
+              percentage changed nor PROGRESS_BAR_MIN_INTERVAL seconds passed; the final
+              step (progress == total) is always drawn.
     """
+    percent = int((progress / total) * 100) if total else 100
+    now = time.perf_counter()
+    draw_key = (total, percent)
+    if (progress < total and draw_key == _progress_bar_state['key']
+            and now - _progress_bar_state['time'] < PROGRESS_BAR_MIN_INTERVAL):
+        return
+    _progress_bar_state['key'] = draw_key
+    _progress_bar_state['time'] = now
+
     if use_color:
         # Colored gradient bar (original functionality)
         # Light blue (start): RGB(173, 216, 230)
@@ -277,14 +371,12 @@ def blue_gradient_bar(progress, total, end_color=None, use_color=False):
             else:
                 bar += f"\033[0m-"
         reset = "\033[0m"
-        percent = int((progress / total) * 100) if total else 100
         sys.stdout.write(f"\r[{bar}{reset}] {progress}/{total} directories processed, {percent}%")
         sys.stdout.flush()
     else:
         # Basic ASCII progress bar (no color)
         filled_len = int(bar_len * progress // total) if total else bar_len
         bar = "=" * filled_len + "-" * (bar_len - filled_len)
-        percent = int((progress / total) * 100) if total else 100
         sys.stdout.write(f"\r[{bar}] {progress}/{total} processed, {percent}%")
         sys.stdout.flush()
 
@@ -329,6 +421,25 @@ def get_api_key_file():
         logger.error(f"Error decrypting API key: {e}")
         raise
 
+@lru_cache(maxsize=1)
+def get_smartsheet_client():
+    """
+    Returns the Smartsheet client for this run. The client (and its HTTP connection pool) is
+    created once and reused by every caller, so later API calls skip the connection/TLS setup.
+
+    Returns:
+        smartsheet.Smartsheet: Authenticated client with errors raised as exceptions
+
+    Raises:
+        FileNotFoundError: If the password or encrypted key file is missing.
+        Exception: If decryption of the API key fails.
+    """
+    smartsheet_client = smartsheet.Smartsheet(get_api_key_file(),
+                                              max_connections=SMARTSHEET_MAX_CONNECTIONS,
+                                              max_retry_time=SMARTSHEET_MAX_RETRY_TIME)
+    smartsheet_client.errors_as_exceptions(True)
+    return smartsheet_client
+
 def get_sql_password():
     """
     Reads an encryption key from a text file and uses it to decrypt the SQL database password.
@@ -360,26 +471,30 @@ def convert_sheet_to_dataframe(sheet):
 
     Returns:
         pd.DataFrame: DataFrame containing the sheet's data, with columns matching the sheet's 
-        column titles. Empty cells are returned as None. Column order matches the Smartsheet sheet.
-        Includes '_row_id' column with Smartsheet row IDs for tracking purposes.
+        column titles. Empty cells are returned as NaN: with exclude='nonexistentCells' they are missing
+        from the rows, so a column with no values at all is float64. Column order matches the Smartsheet
+        sheet. Includes '_row_id' column with Smartsheet row IDs for tracking purposes.
     """
     try:
         logger.debug(f"Converting Smartsheet with {len(sheet.rows)} rows and {len(sheet.columns)} columns")
         
-        data = []
         columns = [col.title for col in sheet.columns]
+        column_index = {col.id: idx for idx, col in enumerate(sheet.columns)}
         total_rows = len(sheet.rows)
         
         logger.debug(f"Column names: {columns}")
         
+        # Fill one preallocated list per column instead of building a dict per row.
+        # Cells missing from a row stay NaN, matching the previous row-dict behavior.
+        row_ids = [None] * total_rows
+        column_values = [[np.nan] * total_rows for _ in columns]
+
         for idx, row in enumerate(sheet.rows):
-            row_data = {'_row_id': row.id}  # Add Smartsheet row ID
+            row_ids[idx] = row.id  # Smartsheet row ID
             for cell in row.cells:
-                if cell.column_id in [col.id for col in sheet.columns]:
-                    col_index = [col.id for col in sheet.columns].index(cell.column_id)
-                    row_data[columns[col_index]] = cell.value
-
-            data.append(row_data)
+                col_idx = column_index.get(cell.column_id)
+                if col_idx is not None:
+                    column_values[col_idx][idx] = cell.value
 
             # Show progress bar
             blue_gradient_bar(idx + 1, total_rows, color_options[2])  # Using Dark Blue as end color
@@ -387,10 +502,14 @@ def convert_sheet_to_dataframe(sheet):
         print()
         print() 
 
-        logger.debug(f"Extracted {len(data)} rows of data")
+        logger.debug(f"Extracted {total_rows} rows of data")
         
         # Add '_row_id' to columns for DataFrame
-        df = pd.DataFrame(data, columns=['_row_id'] + columns)
+        if total_rows:
+            df = pd.DataFrame(dict(zip(['_row_id'] + columns, [row_ids] + column_values)), columns=['_row_id'] + columns)
+            df['_row_id'] = df['_row_id'].astype('int64')  # Smartsheet row IDs are 64-bit
+        else:
+            df = pd.DataFrame(columns=['_row_id'] + columns)
         logger.debug(f"DataFrame created with shape: {df.shape}")
         return df
         
@@ -399,9 +518,86 @@ def convert_sheet_to_dataframe(sheet):
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise
 
+def ensure_c_contiguous(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Makes sure every numeric column of a DataFrame is backed by a C-contiguous array.
+    Some copy/merge paths leave columns as strided views (Fortran-ordered blocks), which can make
+    later groupby/merge operations an order of magnitude slower.
+
+    Args:
+        df (pd.DataFrame): DataFrame to check
+
+    Returns:
+        pd.DataFrame: The same DataFrame if already contiguous, otherwise a rebuilt copy
+    """
+    try:
+        strided_positions = set()
+        for pos in range(df.shape[1]):
+            series = df.iloc[:, pos]
+            if isinstance(series.dtype, np.dtype) and series.dtype != object:
+                if not series.to_numpy().flags.c_contiguous:
+                    strided_positions.add(pos)
+
+        if not strided_positions:
+            return df
+
+        logger.debug(f"Rebuilding {len(strided_positions)} non-contiguous columns")
+        data = {}
+        for pos in range(df.shape[1]):
+            series = df.iloc[:, pos]
+            data[pos] = np.ascontiguousarray(series.to_numpy()) if pos in strided_positions else series.array
+        contiguous_df = pd.DataFrame(data, index=df.index)
+        contiguous_df.columns = df.columns
+        return contiguous_df
+
+    except Exception as e:
+        logger.warning(f"Could not verify DataFrame memory layout: {e}")
+        return df
+
+def downcast_integer_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcasts integer columns to the narrowest integer dtype that holds their values.
+    Float columns are left alone (float32 would change the saved values) and '__file_*'
+    bookkeeping columns keep int64 since they hold nanosecond timestamps and file sizes.
+
+    Args:
+        df (pd.DataFrame): DataFrame to downcast
+
+    Returns:
+        pd.DataFrame: The same DataFrame with integer columns downcast in place
+    """
+    for col in df.columns:
+        if str(col).startswith('__file_'):
+            continue
+        if pd.api.types.is_integer_dtype(df[col].dtype):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+def _loads_json(content: bytes):
+    """
+    Parses JSON bytes with orjson, falling back to the stdlib json module if orjson is not
+    installed or rejects the content (e.g. NaN/Infinity written by json.dump).
+
+    Args:
+        content (bytes): Raw JSON file content
+
+    Returns:
+        The parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 def load_json_file(file_path: str, default_value=None):
     """
-    Loads data from a JSON file with error handling.
+    Loads data from a JSON file with error handling. The file is parsed with orjson when it
+    is installed (see _loads_json()).
 
     Args:
         file_path (str): Path to the JSON file to load
@@ -413,8 +609,8 @@ def load_json_file(file_path: str, default_value=None):
     try:
         if os.path.isfile(file_path):
             if os.path.getsize(file_path) > 0:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(file_path, 'rb') as f:
+                    return _loads_json(f.read())
             else:
                 print(f"⚠ File is empty: {file_path}")
                 return default_value if default_value is not None else []
@@ -443,9 +639,36 @@ def load_json_file(file_path: str, default_value=None):
         return default_value if default_value is not None else []
         return default_value if default_value is not None else []
 
+def load_json_files(file_paths: list, default_value=None) -> list:
+    """
+    Loads several JSON files at once with load_json_file(), one thread per file, so the
+    open/read latency of files on a network share overlaps instead of adding up.
+
+    Args:
+        file_paths (list): Paths to the JSON files to load
+        default_value: Value to return for a file that doesn't exist or is corrupted (default: None)
+
+    Returns:
+        list: The loaded data for each path, in the same order as file_paths
+    """
+    if not file_paths:
+        return []
+    with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+        return list(executor.map(lambda file_path: load_json_file(file_path, default_value=default_value), file_paths))
+
+def _json_default(value):
+    """
+    orjson default hook matching json.dump(default=str): float subclasses (e.g. numpy.float64)
+    are written as numbers, any other unsupported value as str(value).
+    """
+    if isinstance(value, float):
+        return float(value)
+    return str(value)
+
 def save_json_file(data, file_path: str, create_dir=True):
     """
-    Saves data to a JSON file with error handling.
+    Saves data to a JSON file with error handling. The file is encoded with orjson when it is
+    installed (NaN/Infinity are written as null), otherwise with the json module.
 
     Args:
         data: The data to save (must be JSON serializable)
@@ -462,7 +685,16 @@ def save_json_file(data, file_path: str, create_dir=True):
             if directory:
                 os.makedirs(directory, exist_ok=True)
         
-        # Save the data
+        # Save the data (orjson when available, it encodes several times faster than the json module)
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(data, default=_json_default, option=ORJSON_SAVE_OPTIONS)
+                with open(file_path, 'wb') as f:
+                    f.write(payload)
+                return True
+            except orjson.JSONEncodeError as e:
+                logger.debug(f"orjson could not encode {file_path} ({e}), using json module")
+
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, default=str, ensure_ascii=False)
         
@@ -481,13 +713,331 @@ def save_json_file(data, file_path: str, create_dir=True):
         print(f"⚠ Unexpected error saving {file_path}: {e}")
         return False
 
-def load_assembly_job_data(network_dir: str, log_camData_path: str) -> pd.DataFrame:
+def get_cam_data_parquet_path(log_camData_path: str) -> str:
+    """Returns the Parquet path used in place of log_camData.json when FAST_IO is enabled"""
+    return os.path.splitext(log_camData_path)[0] + '.parquet'
+
+def get_cam_data_hash_path(log_camData_path: str) -> str:
+    """Returns the path of the file holding the content hash of the last saved camData"""
+    return os.path.splitext(log_camData_path)[0] + '.hash'
+
+def cam_data_to_records(df: pd.DataFrame) -> list:
+    """
+    Converts a camData DataFrame to the list of record dictionaries load_cam_data() returns:
+    plain Python values (categories as their values, no numpy scalars) and missing values as None.
+
+    Args:
+        df (pd.DataFrame): camData DataFrame
+
+    Returns:
+        list: List of camData record dictionaries
+    """
+    df = df.astype(object)
+    return df.where(df.notna(), None).to_dict(orient="records")
+
+def _encode_json_column(values) -> list:
+    """
+    Encodes each value of a mixed-type column as JSON text for the Parquet camData file. orjson
+    writes floats with full precision; without it pandas' ujson encoder is used with its maximum
+    of 15 significant digits (its default of 10 would round the stored values).
+
+    Args:
+        values: Column values (missing values are written as null)
+
+    Returns:
+        list: JSON text for each value
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        try:
+            return [orjson.dumps(value, default=_json_default, option=option).decode('utf-8') for value in values]
+        except orjson.JSONEncodeError as e:
+            logger.debug(f"orjson could not encode column values ({e}), using ujson")
+    return [pd.io.json.ujson_dumps(value, double_precision=15) for value in values]
+
+def _decode_json_column(values) -> list:
+    """Decodes a column written by _encode_json_column() (with _loads_json(), so floats are parsed exactly)"""
+    return [_loads_json(value) for value in values]
+
+def _read_cam_data_parquet(parquet_path: str) -> list:
+    """
+    Reads camData records from a Parquet file written by save_cam_data.
+
+    Args:
+        parquet_path (str): Path to log_camData.parquet
+
+    Returns:
+        list: List of camData record dictionaries (missing values as None, matching the JSON format)
+    """
+    table = pq.read_table(parquet_path)
+    metadata = table.schema.metadata or {}
+    json_columns = json.loads(metadata.get(b'cam_json_columns', b'[]'))
+
+    # Integer columns with missing values stay Python ints/None (not float64), as in the JSON log
+    df = table.to_pandas(integer_object_nulls=True)
+    for col in json_columns:
+        # object dtype so a column of ints and nulls is not inferred as float64
+        df[col] = pd.Series(_decode_json_column(df[col]), index=df.index, dtype=object)
+
+    return cam_data_to_records(df)
+
+def _write_cam_data_parquet(df: pd.DataFrame, parquet_path: str):
+    """
+    Writes camData records to a zstd-compressed Parquet file.
+
+    Object columns holding more than one value type (e.g. 'Turn' with ints and blank strings)
+    cannot be stored natively by pyarrow, so each value in those columns is stored as JSON text
+    (see _encode_json_column()) and the column names are recorded in the file metadata so they can be decoded on load.
+
+    Args:
+        df (pd.DataFrame): camData DataFrame to save
+        parquet_path (str): Path to log_camData.parquet
+    """
+    out = df.copy()
+    json_columns = []
+    for col in out.columns:
+        if out[col].dtype == object and len({type(value) for value in out[col] if value is not None}) > 1:
+            out[col] = _encode_json_column(out[col])
+            json_columns.append(col)
+
+    table = pa.Table.from_pandas(out, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b'cam_json_columns'] = json.dumps(json_columns).encode('utf-8')
+    pq.write_table(table.replace_schema_metadata(metadata), parquet_path, compression='zstd')
+
+def _cam_records_to_json(records: list, indent: bool = False) -> bytes:
+    """
+    Encodes camData records as UTF-8 JSON with orjson, falling back to pandas' bundled ujson
+    encoder if orjson is not installed or cannot encode the records.
+
+    Args:
+        records (list): camData record dictionaries
+        indent (bool): Indent with 2 spaces (for the debug copy). Defaults to False.
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(records, default=_json_default, option=option)
+        except orjson.JSONEncodeError as e:
+            logger.debug(f"orjson could not encode cam data ({e}), using ujson")
+    return pd.io.json.ujson_dumps(records, indent=2 if indent else 0, double_precision=15).encode('utf-8')
+
+def load_cam_data(log_camData_path: str) -> list:
+    """
+    Loads the cached camData records. When FAST_IO is enabled and pyarrow is installed the
+    Parquet copy (log_camData.parquet) is used, otherwise log_camData.json is parsed with
+    _loads_json() (orjson, or the stdlib json module if orjson is not installed).
+
+    Args:
+        log_camData_path (str): Path to log_camData.json
+
+    Returns:
+        list: List of camData record dictionaries, or [] if the file is missing/empty/corrupted
+    """
+    if FAST_IO and pq is not None:
+        parquet_path = get_cam_data_parquet_path(log_camData_path)
+        if os.path.isfile(parquet_path) and os.path.getsize(parquet_path) > 0:
+            try:
+                return _read_cam_data_parquet(parquet_path)
+            except Exception as e:
+                logger.warning(f"Error reading {parquet_path}: {e}. Falling back to JSON.")
+
+    if not os.path.isfile(log_camData_path) or os.path.getsize(log_camData_path) == 0:
+        logger.debug(f"No existing cam data log found at {log_camData_path}")
+        return []
+
+    try:
+        with open(log_camData_path, "rb") as f:
+            content = f.read()
+        old_data = _loads_json(content)
+        if not isinstance(old_data, list):
+            logger.warning(f"Unexpected data in {log_camData_path} (expected a list). Starting fresh.")
+            return []
+        return old_data
+    except ValueError as ve:
+        logger.warning(f"JSON decode error in {log_camData_path}: {ve}. Starting fresh.")
+        return []
+    except Exception as e:
+        logger.warning(f"Error reading {log_camData_path}: {e}. Starting fresh.")
+        return []
+
+def save_cam_data(df: pd.DataFrame, log_camData_path: str) -> bool:
+    """
+    Saves camData records to disk. When FAST_IO is enabled and pyarrow is installed the records
+    are written to log_camData.parquet, otherwise (or if the Parquet write fails) they are written
+    to log_camData.json with _cam_records_to_json(). Only one of the two files is kept, so a
+    stale copy in the other format is never loaded. When debug_output is enabled an
+    indented copy is also written to log_camData_debug.json for manual inspection.
+
+    A blake2b hash of the encoded records is kept in log_camData.hash; if the records (and the
+    file format) are the same as last time and the file is still there, nothing is written.
+
+    Args:
+        df (pd.DataFrame): camData DataFrame to save
+        log_camData_path (str): Path to log_camData.json
+
+    Returns:
+        bool: True if successful, False if failed
+    """
+    try:
+        directory = os.path.dirname(log_camData_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        records = df.to_dict(orient="records")
+
+        if debug_output:
+            debug_path = os.path.splitext(log_camData_path)[0] + '_debug.json'
+            with open(debug_path, "wb") as f:
+                f.write(_cam_records_to_json(records, indent=True))
+
+        # Skip the write when the records are unchanged since the last save
+        content = _cam_records_to_json(records)
+        content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+        hash_path = get_cam_data_hash_path(log_camData_path)
+        parquet_path = get_cam_data_parquet_path(log_camData_path)
+        use_parquet = FAST_IO and pq is not None
+        saved_path = parquet_path if use_parquet else log_camData_path
+        saved_hash = f"{'parquet' if use_parquet else 'json'}:{content_hash}"
+
+        try:
+            with open(hash_path, "r") as f:
+                previous_hash = f.read().strip()
+        except OSError:
+            previous_hash = None
+
+        if previous_hash == saved_hash and os.path.isfile(saved_path):
+            logger.info(f"Cam data unchanged, skipping write of {saved_path}")
+            # A JSON log left by an earlier run would be read in place of the Parquet copy without pyarrow
+            if use_parquet and os.path.isfile(log_camData_path):
+                os.remove(log_camData_path)
+            return True
+
+        if use_parquet:
+            try:
+                _write_cam_data_parquet(df, parquet_path)
+
+                # Remove any stale JSON copy so it is never read in place of the Parquet just written
+                # (load_cam_data() uses the JSON when pyarrow is missing or FAST_IO is turned off)
+                if os.path.isfile(log_camData_path):
+                    os.remove(log_camData_path)
+
+                with open(hash_path, "w") as f:
+                    f.write(saved_hash)
+                return True
+            except Exception as e:
+                logger.warning(f"Could not write {parquet_path}: {e}. Falling back to JSON.")
+
+        with open(log_camData_path, "wb") as f:
+            f.write(content)
+
+        # Remove any stale Parquet copy so the next load reads the JSON just written
+        if os.path.isfile(parquet_path):
+            os.remove(parquet_path)
+
+        with open(hash_path, "w") as f:
+            f.write(f"json:{content_hash}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving cam data to {log_camData_path}: {e}")
+        return False
+
+def parse_camreadme(camreadme_path: str) -> dict:
+    """
+    Parses a single camReadme.txt file into a dictionary of fields.
+    Each line containing a '|' is split into 'key|value'; keys and values are stripped of whitespace
+    and any trailing '|' characters are removed from the values.
+
+    Args:
+        camreadme_path (str): Path to the camReadme.txt file
+
+    Returns:
+        dict: Field name to value mapping for the file
+    """
+    with open(camreadme_path, "r", encoding="utf-8", errors="ignore") as f:
+        text = f.read()
+
+    # One pass over the whole file with the precompiled pattern instead of a split per line
+    return {match[1].strip(): match[2].strip().rstrip('|') for match in _CAMREADME_FIELD_RE.finditer(text)}
+
+def _scan_job_directory(entry_path: str, old_lookup: dict) -> tuple:
+    """
+    Checks a single job directory for a camReadme.txt file and returns its record.
+    The cached record is reused when the file's modification time (ns) and size are unchanged.
+
+    Args:
+        entry_path (str): Path to the job directory
+        old_lookup (dict): Cached camData records keyed by '__file_path__'
+
+    Returns:
+        tuple: (status, entry) where status is 'cached', 'read', 'error', or None if the
+            directory has no camReadme.txt file
+    """
+    camreadme_path = os.path.normpath(os.path.join(entry_path, "camReadme.txt"))
+
+    try:
+        file_stat = os.stat(camreadme_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None, None
+    except OSError as ose:
+        logger.error(f"OS error accessing {camreadme_path}: {ose}")
+        return 'error', None
+
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None, None
+
+    # Step 3: Check if file is unchanged (same modification time in ns and same size)
+    cached_entry = old_lookup.get(camreadme_path)
+    if (cached_entry is not None
+            and cached_entry.get("__file_mtime_ns__") == file_stat.st_mtime_ns
+            and cached_entry.get("__file_size__") == file_stat.st_size):
+        return 'cached', cached_entry
+
+    # Step 4: Parse new/changed file
+    try:
+        entry = parse_camreadme(camreadme_path)
+        entry['__file_path__'] = camreadme_path
+        entry['__file_mtime__'] = file_stat.st_mtime
+        entry['__file_mtime_ns__'] = file_stat.st_mtime_ns
+        entry['__file_size__'] = file_stat.st_size
+        return 'read', entry
+
+    except Exception as e:
+        logger.error(f"Error reading {camreadme_path}: {e}")
+        if DEBUG:
+            logger.debug(f"Traceback: {traceback.format_exc()}")
+        return 'error', None
+
+def list_job_directories(assembly_active_directory: str) -> list:
+    """
+    Lists the job directories in the assembly directory with one os.scandir call (the entry type
+    comes with the listing, so there is no extra stat per directory on the network share).
+    The result is shared by load_assembly_job_data(), build_master_bom() and parts_po_file().
+
+    Args:
+        assembly_active_directory (str): Path to directory containing assembly job folders
+
+    Returns:
+        list: Names of the subdirectories, in listing order
+    """
+    with os.scandir(assembly_active_directory) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
+
+def load_assembly_job_data(network_dir: str, log_camData_path: str, directory_names: list = None) -> pd.DataFrame:
     """
     Scans the top-level directories in the given network path for camReadme.txt files, parses their contents,
     and returns a DataFrame of the results.
 
     Args:
         network_dir (str): The network directory to search. Each subdirectory is checked for a camReadme.txt file.
+        log_camData_path (str): Path to log_camData.json (cached records of the previous run)
+        directory_names (list, optional): Subdirectory names from list_job_directories().
+            network_dir is listed if None.
 
     Returns:
         pd.DataFrame: DataFrame containing parsed data from all camReadme.txt files found.
@@ -495,6 +1045,8 @@ def load_assembly_job_data(network_dir: str, log_camData_path: str) -> pd.DataFr
 
     Notes:
         - Only the top-level subdirectories of network_dir are searched (not recursive).
+        - Files whose modification time (ns) and size match the cached record in log_camData_path
+          are not re-read; the cached record is reused.
         - Progress is printed to the terminal using a bar of length bar_len from defines.py.
     """
     try:
@@ -502,20 +1054,11 @@ def load_assembly_job_data(network_dir: str, log_camData_path: str) -> pd.DataFr
         data = []
 
         # Step 1: Load previous data if available
-        if os.path.isfile(log_camData_path) and os.path.getsize(log_camData_path) > 0:
-            try:
-                with open(log_camData_path, "r") as f:
-                    old_data = json.load(f)
-                old_lookup = {entry["__file_path__"]: entry for entry in old_data}
-                logger.debug(f"Loaded {len(old_lookup)} existing records from cache")
-            except json.JSONDecodeError as je:
-                logger.warning(f"JSON decode error in {log_camData_path}: {je}. Starting fresh.")
-                old_lookup = {}
-            except Exception as e:
-                logger.warning(f"Error loading previous data: {e}. Starting fresh.")
-                old_lookup = {}
-        else:
-            logger.debug("No existing cache found, will scan all files")
+        try:
+            old_lookup = {entry["__file_path__"]: entry for entry in load_cam_data(log_camData_path)}
+            logger.debug(f"Loaded {len(old_lookup)} existing records from cache")
+        except Exception as e:
+            logger.warning(f"Error loading previous data: {e}. Starting fresh.")
             old_lookup = {}
 
         # Verify network directory exists and is accessible
@@ -524,7 +1067,9 @@ def load_assembly_job_data(network_dir: str, log_camData_path: str) -> pd.DataFr
             raise FileNotFoundError(f"Network directory not found: {network_dir}")
         
         try:
-            dir_names = [entry_name for entry_name in os.listdir(network_dir) if os.path.isdir(os.path.join(network_dir, entry_name))]
+            if directory_names is None:
+                directory_names = list_job_directories(network_dir)
+            dir_paths = [os.path.join(network_dir, name) for name in directory_names]
         except PermissionError as pe:
             logger.error(f"Permission denied accessing network directory: {pe}")
             raise
@@ -532,58 +1077,30 @@ def load_assembly_job_data(network_dir: str, log_camData_path: str) -> pd.DataFr
             logger.error(f"Error listing network directory: {e}")
             raise
         
-        total_dirs = len(dir_names)
+        total_dirs = len(dir_paths)
         logger.info(f"Found {total_dirs} directories to scan")
         
         files_read = 0
         files_cached = 0
         files_errors = 0
 
-        for idx, entry_name in enumerate(dir_names):
-            entry_path = os.path.join(network_dir, entry_name)
-            camreadme_path = os.path.normpath(os.path.join(entry_path, "camReadme.txt"))
-
-            if os.path.isfile(camreadme_path):
-                try:
-                    mtime = os.path.getmtime(camreadme_path)
-                    # Step 3: Check if file is unchanged
-                    if camreadme_path in old_lookup and old_lookup[camreadme_path].get("__file_mtime__") == mtime:
-                        entry = old_lookup[camreadme_path]
-                        data.append(entry)
-                        files_cached += 1
-                    else:
-                        # Step 4: Parse new/changed file
-                        try:
-                            with open(camreadme_path, "r", encoding="utf-8", errors="ignore") as f:
-                                entry = {}
-                                lines = f.readlines()
-                                for line in lines:
-                                    if '|' in line:
-                                        key, value = line.strip().split('|', 1)
-                                        entry[key.strip()] = value.strip()
-                                entry['__file_path__'] = camreadme_path
-                                entry['__file_mtime__'] = mtime
-
-                            for k, v in entry.items():
-                                if isinstance(v, str):
-                                    entry[k] = v.rstrip('|')
-
-                            data.append(entry)
-                            files_read += 1
-
-                        except Exception as e:
-                            logger.error(f"Error reading {camreadme_path}: {e}")
-                            files_errors += 1
-                            if DEBUG:
-                                logger.debug(f"Traceback: {traceback.format_exc()}")
-                            continue
-                except OSError as ose:
-                    logger.error(f"OS error accessing {camreadme_path}: {ose}")
+        # Step 2: Check/read each camReadme.txt in a thread pool so network file reads overlap.
+        # map() returns results in directory order, so the record order is unchanged.
+        with ThreadPoolExecutor(max_workers=FILE_SCAN_WORKERS) as executor:
+            results = executor.map(lambda entry_path: _scan_job_directory(entry_path, old_lookup), dir_paths)
+
+            for idx, (status, entry) in enumerate(results):
+                if status == 'cached':
+                    data.append(entry)
+                    files_cached += 1
+                elif status == 'read':
+                    data.append(entry)
+                    files_read += 1
+                elif status == 'error':
                     files_errors += 1
-                    continue
 
-            # Print color gradient progress bar
-            blue_gradient_bar(idx + 1, total_dirs, color_options[1])
+                # Print color gradient progress bar
+                blue_gradient_bar(idx + 1, total_dirs, color_options[1])
         # Newline after progress bar
         print()
         print() 
@@ -661,7 +1178,8 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
                     f.write(f"{order_no}\n")
                 f.write("\n" + "=" * 50 + "\n")
                 f.write(f"Total unique order numbers: {len(unique_order_nos)}\n")
-            print(f"  DEBUG: Saved order numbers to {debug_order_nos_path}")
+            if debug_output:
+                print(f"  DEBUG: Saved order numbers to {debug_order_nos_path}")
             
             # Build parameterized query with IN clause
             placeholders = ','.join(['?' for _ in unique_order_nos])
@@ -680,12 +1198,14 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
                 f.write("\n\n" + "=" * 50 + "\n")
                 f.write(f"Number of placeholders: {len(unique_order_nos)}\n")
                 f.write(f"Parameters tuple length: {len(unique_order_nos)}\n")
-            print(f"  DEBUG: Saved query to {debug_query_path}")
+            if debug_output:
+                print(f"  DEBUG: Saved query to {debug_query_path}")
             
             # Execute single batch query
             results = execute_custom_query(query, tuple(unique_order_nos))
             
-            print(f"  DEBUG: Query returned {len(results)} results")
+            if debug_output:
+                print(f"  DEBUG: Query returned {len(results)} results")
 
             # DEBUG: Save query results to file
             debug_results_path = get_save_path('debug_query_results.txt')
@@ -721,8 +1241,9 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
                 order_key = str(row['order_no']).strip()
                 order_credit_hold[order_key] = row['credit_hold']
             
-            print(f"  DEBUG: Sample DB results: {list(order_credit_hold.items())[:5]}")
-            print(f"  DEBUG: Sample WO mappings: {list(wo_to_order_map.items())[:5]}")
+            if debug_output:
+                print(f"  DEBUG: Sample DB results: {list(order_credit_hold.items())[:5]}")
+                print(f"  DEBUG: Sample WO mappings: {list(wo_to_order_map.items())[:5]}")
             
             # Map back to WO# numbers
             for wo_number, order_no in wo_to_order_map.items():
@@ -732,7 +1253,8 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
                 if order_no_str in order_credit_hold:
                     if order_credit_hold[order_no_str] == 1:
                         db_credit_holds.add(wo_number)
-                        print(f"  DEBUG: Found credit hold in DB for {wo_number} (order {order_no_str})")
+                        if debug_output:
+                            print(f"  DEBUG: Found credit hold in DB for {wo_number} (order {order_no_str})")
             
             # DEBUG: Save WO to order mapping
             debug_mapping_path = get_save_path('debug_wo_to_order_mapping.txt')
@@ -744,7 +1266,8 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
                     f.write(f"WO#: {wo} -> Order: {order} -> Credit Hold: {credit_status}\n")
                 f.write("\n" + "=" * 50 + "\n")
                 f.write(f"Total mappings: {len(wo_to_order_map)}\n")
-            print(f"  DEBUG: Saved WO mappings to {debug_mapping_path}")
+            if debug_output:
+                print(f"  DEBUG: Saved WO mappings to {debug_mapping_path}")
             
             # DEBUG: Save credit holds found
             debug_credit_holds_path = get_save_path('debug_credit_holds_found.txt')
@@ -756,7 +1279,8 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
                     f.write(f"WO#: {wo} (Order: {order})\n")
                 f.write("\n" + "=" * 50 + "\n")
                 f.write(f"Total credit holds found: {len(db_credit_holds)}\n")
-            print(f"  DEBUG: Saved credit holds to {debug_credit_holds_path}")
+            if debug_output:
+                print(f"  DEBUG: Saved credit holds to {debug_credit_holds_path}")
             
             print(f"✓ Database query complete: {len(db_credit_holds)} credit holds found")
             
@@ -850,6 +1374,9 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
     print(f"Processing {len(all_credit_holds)} total credit hold jobs...")
     
     # Step 6: Process jobs using combined credit hold list
+    # One timestamp for all records of this run
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
     for job in cam_data:
         wo_number = str(job.get('WO#', ''))
         status = job.get('Status', '')
@@ -868,7 +1395,7 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
         if wo_number in all_credit_holds:
             # Add timestamp to track when credit hold was detected
             job_with_timestamp = job.copy()
-            job_with_timestamp['Credit_Hold_Date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            job_with_timestamp['Credit_Hold_Date'] = timestamp
             credit_hold_jobs.append(job_with_timestamp)
             
         else:
@@ -878,7 +1405,7 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
             # Check if this job was previously on credit hold
             if wo_number in existing_credit_holds:
                 release_record = job.copy()
-                release_record['Credit_Hold_Released_Date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                release_record['Credit_Hold_Released_Date'] = timestamp
                 credit_hold_released.append(release_record)
     
     print(f"✓ Job processing complete:")
@@ -888,7 +1415,7 @@ def build_active_credithold_files(cam_data: list, existing_credit_holds: set) ->
     
     return active_jobs, credit_hold_jobs, credit_hold_released
 
-def store_smartsheet_user_data(smartsheet_part_tracking_df: pd.DataFrame) -> pd.DataFrame:
+def store_smartsheet_user_data(smartsheet_part_tracking_df: pd.DataFrame, use_color: bool = False) -> list:
     """
     Extracts user-entered data from specified columns in the Smartsheet DataFrame.
     Stores data in a json log file with row ID and WO# for tracking user modifications.
@@ -897,12 +1424,12 @@ def store_smartsheet_user_data(smartsheet_part_tracking_df: pd.DataFrame) -> pd.
     Args:
         smartsheet_part_tracking_df (pd.DataFrame): DataFrame containing Smartsheet data, 
             including a '_row_id' column for row identification.
+        use_color (bool, optional): Whether to show a colored progress bar. Defaults to False.
 
     Returns:
-        None: Saves user data to 'SaveFiles/log_user_entered_data.json' and prints status.
-
-    None: Saves user data to 'SaveFiles/log_user_entered_data.json', creates CSV backup,
-            and prints status. Deletes backups older than 15 days.
+        list: The user-entered data records saved to 'SaveFiles/log_user_entered_data.json'
+              ([] if there is no Smartsheet data or storing failed). Also creates a CSV backup,
+              prints status and deletes backups older than 15 days.
     """
     try:
         # Create Backups directory if it doesn't exist
@@ -949,38 +1476,45 @@ def store_smartsheet_user_data(smartsheet_part_tracking_df: pd.DataFrame) -> pd.
 
             total_rows = len(smartsheet_part_tracking_df)
             
-            for index, row in smartsheet_part_tracking_df.iterrows():
+            # Column lookups are done once; rows are walked as tuples of plain values instead of
+            # building a Series per row with iterrows()
+            has_row_id = '_row_id' in smartsheet_part_tracking_df.columns
+            has_wo = 'WO#' in smartsheet_part_tracking_df.columns
+            present_user_columns = [col for col in user_entered_columns if col in smartsheet_part_tracking_df.columns]
+            
+            empty_column = [None] * total_rows
+            row_ids = smartsheet_part_tracking_df['_row_id'].tolist() if has_row_id else empty_column
+            wo_numbers = smartsheet_part_tracking_df['WO#'].tolist() if has_wo else empty_column
+            user_values = [smartsheet_part_tracking_df[col].tolist() for col in present_user_columns]
+            
+            for position, (row_id, wo_number, *values) in enumerate(zip(row_ids, wo_numbers, *user_values)):
                 # Check if any of the user-entered columns have non-null values
                 has_user_data = False
                 row_data = {}
                 
-                # Include essential columns only: _row_id, WO#, and user-entered columns
-                essential_columns = ['_row_id', 'WO#'] + user_entered_columns
-                
                 # Add _row_id for reference if it exists
-                if '_row_id' in smartsheet_part_tracking_df.columns:
-                    row_data['_row_id'] = row['_row_id']
+                if has_row_id:
+                    row_data['_row_id'] = row_id
                 
                 # Add WO# for identification if it exists
-                if 'WO#' in smartsheet_part_tracking_df.columns:
-                    row_data['WO#'] = row['WO#'] if pd.notna(row['WO#']) else None
+                if has_wo:
+                    row_data['WO#'] = wo_number if pd.notna(wo_number) else None
                 
                 # Process user-entered columns
-                for col in user_entered_columns:
-                    if col in smartsheet_part_tracking_df.columns:
-                        # Check if this user-entered column has data
-                        if pd.notna(row[col]) and str(row[col]).strip() != '':
-                            has_user_data = True
-                            row_data[col] = row[col]
-                        else:
-                            row_data[col] = None
+                for col, value in zip(present_user_columns, values):
+                    # Check if this user-entered column has data
+                    if pd.notna(value) and str(value).strip() != '':
+                        has_user_data = True
+                        row_data[col] = value
+                    else:
+                        row_data[col] = None
                 
                 # Only include rows that have some user-entered data
                 if has_user_data:
                     user_entered_data.append(row_data)
 
                 # Show progress bar
-                blue_gradient_bar(index + 1, total_rows, color_options[7])
+                blue_gradient_bar(position + 1, total_rows, color_options[7], use_color)
             # Newline after progress bar
             print()
             print()
@@ -996,23 +1530,28 @@ def store_smartsheet_user_data(smartsheet_part_tracking_df: pd.DataFrame) -> pd.
             
             print(f"User-entered data saved: {len(user_entered_data)} records with user input")
             print(f"File location: {user_data_file_path}")
+            return user_entered_data
         
         else:
             print("No smartsheet data available to extract user-entered information")
             # Create empty file
             with open(get_save_path('log_user_entered_data.json'), 'w') as file:
                 json.dump([], file)
+            return []
 
     except Exception as e:
         print(f"Error storing user-entered data: {e}")
         # Create empty file on error
         with open(get_save_path('log_user_entered_data.json'), 'w') as file:
             json.dump([], file)
+        return []
 
+@lru_cache(maxsize=65536)
 def extract_first_designator(designators_string):
     """
     Extract the first designator from a string that may contain multiple designators
-    separated by comma, space, semicolon, or ranges with dashes.
+    separated by comma, space, semicolon, or ranges with dashes. Results are memoized,
+    since the same designator strings repeat across BOM rows and work orders.
     
     Args:
         designators_string (str): String containing designators (e.g., "C1,C2,C3" or "R1-R10")
@@ -1023,28 +1562,24 @@ def extract_first_designator(designators_string):
     if not designators_string:
         return ''
     
-    # Handle different separators: comma, semicolon, space
-    # First try comma separation (most common)
-    if ',' in designators_string:
-        return designators_string.split(',')[0].strip()
-    
-    # Then try semicolon separation
-    if ';' in designators_string:
-        return designators_string.split(';')[0].strip()
-    
-    # Handle range notation like "C1-C70" - return the first part
-    if '-' in designators_string and not designators_string.startswith('-'):
-        # Make sure it's not a negative number by checking if there's a letter before the dash
-        parts = designators_string.split('-')
-        if len(parts) >= 2 and any(c.isalpha() for c in parts[0]):
-            return parts[0].strip()
-    
-    # Handle space separation (least common, check last to avoid splitting ranges)
-    if ' ' in designators_string:
-        return designators_string.split(' ')[0].strip()
-    
-    # If no separators found, return the whole string stripped
-    return designators_string.strip()
+    match = _FIRST_DES_RE.match(designators_string)
+    return match.group(match.lastindex).strip()
+
+def first_designators(designators: pd.Series) -> pd.Series:
+    """
+    Column-wise version of extract_first_designator() using Series.str.extract. Each distinct
+    designator string is only parsed once and the results are mapped back to the rows.
+
+    Args:
+        designators (pd.Series): Designator strings (None/NaN treated as empty)
+
+    Returns:
+        pd.Series: First designator of each value, '' for empty values
+    """
+    codes, unique_designators = pd.factorize(designators.fillna('').astype(str))
+    groups = pd.Series(unique_designators, dtype=object).str.extract(_FIRST_DES_RE, expand=True)
+    firsts = groups.bfill(axis=1).iloc[:, 0].fillna('').str.strip()
+    return pd.Series(firsts.to_numpy(dtype=object)[codes], index=designators.index, dtype=object)
 
 def format_mmddyy(date_str):
     """
@@ -1066,14 +1601,130 @@ def format_mmddyy(date_str):
     except Exception:
         return str(date_str)  # fallback to original if parsing fails
 
-def build_master_bom(jobs_df: pd.DataFrame, assembly_active_directory: str, debug_output: bool = False) -> pd.DataFrame:
+_MDY_DATE_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$')
+
+def format_mmddyy_values(values):
     """
-    Scans assembly directories for stdBOM files and builds a master BOM DataFrame from active jobs.
-    
-    Args:
+    Column-wise format_mmddyy() for a whole list of date values.
+
+    Plain YYYY-MM-DD and MM/DD/YYYY strings are parsed together with pd.to_datetime; every
+    other value (two digit years, free text, None) goes through format_mmddyy() once per
+    distinct value, so the output matches calling format_mmddyy() on each item.
+
+    Args:
+        values (list): Date values as read from the camData records
+
+    Returns:
+        list: Dates in YYYY-MM-DD format, original strings where parsing fails,
+              or empty strings for None/null values
+    """
+    results = [None] * len(values)
+    fallback_positions = list(range(len(values)))
+
+    for pattern, date_format in ((_ISO_DATE_RE, '%Y-%m-%d'), (_MDY_DATE_RE, '%m/%d/%Y')):
+        positions = [pos for pos in fallback_positions
+                     if isinstance(values[pos], str) and pattern.match(values[pos])]
+        if not positions:
+            continue
+        parsed = pd.to_datetime(pd.Series([values[pos] for pos in positions], dtype=object),
+                                format=date_format, errors='coerce')
+        formatted = parsed.dt.strftime('%Y-%m-%d')
+        parsed_positions = set()
+        for pos, is_valid, text in zip(positions, parsed.notna().tolist(), formatted.tolist()):
+            if is_valid:
+                results[pos] = text
+                parsed_positions.add(pos)
+        fallback_positions = [pos for pos in fallback_positions if pos not in parsed_positions]
+
+    formatted_by_value = {}
+    for pos in fallback_positions:
+        value = values[pos]
+        try:
+            if value not in formatted_by_value:
+                formatted_by_value[value] = format_mmddyy(value)
+            results[pos] = formatted_by_value[value]
+        except TypeError:
+            results[pos] = format_mmddyy(value)  # unhashable value
+
+    return results
+
+def _read_stdbom_records(matching_wo: str, quote_number: str, dir_path: str) -> tuple:
+    """
+    Reads the BOM records from the first stdBOM*.txt file in a job directory.
+
+    Args:
+        matching_wo (str): WO# of the job the directory belongs to
+        quote_number (str): Quote# of the job
+        dir_path (str): Path to the job directory
+
+    Returns:
+        tuple: Three-element tuple containing:
+            - bom_records (list): BOM record dictionaries (WO#, Quote#, Part_Number, MPN, ...)
+            - parsed (bool): True if a stdBOM file was found and read
+            - error (str or None): Error message if the directory or file could not be read
+    """
+    try:
+        files = os.listdir(dir_path)
+        stdbom_files = [f for f in files if 'stdBOM' in f and f.endswith('.txt')]
+        if not stdbom_files:
+            return [], False, None
+        
+        # Use the first stdBOM file found
+        stdbom_path = os.path.join(dir_path, stdbom_files[0])
+    except Exception as e:
+        return [], False, f"Error accessing directory {dir_path}: {e}"
+
+    # Parse the stdBOM file
+    bom_records = []
+    try:
+        with open(stdbom_path, 'r', encoding='utf-8', errors='ignore') as f:
+            lines = f.readlines()
+            
+        for line in lines:
+            line = line.strip()
+            if line and '|' in line:
+                # Split by pipe delimiter
+                parts = line.split('|')
+                
+                # Create BOM record with WO# as first column
+                bom_record = {
+                    'WO#': matching_wo,
+                    'Quote#': quote_number
+                }
+                
+                # Add all columns
+                bom_record['Part_Number'] = parts[0] if len(parts) > 0 else ''      # white
+                bom_record['MPN'] = parts[1] if len(parts) > 1 else ''              # blue
+                bom_record['API_URL'] = parts[2] if len(parts) > 2 else ''          # yellow
+                bom_record['Description'] = parts[3] if len(parts) > 3 else ''      # green
+                bom_record['Designators'] = parts[4] if len(parts) > 4 else ''      # orange
+                bom_record['Designator_Count'] = parts[5] if len(parts) > 5 else '' # lt blue
+                bom_record['Source'] = parts[6] if len(parts) > 6 else ''           # lt green
+                bom_record['Line_Number'] = parts[7] if len(parts) > 7 else ''      # teal - 0=pcb, 1000=stencil
+                bom_record['Req_Qty'] = parts[8] if len(parts) > 8 else ''          # med blue
+                bom_record['Recvd_Qty'] = parts[9] if len(parts) > 9 else ''        # red
+                bom_record['Date_Complete'] = parts[10] if len(parts) > 10 else ''  # white
+                bom_record['Notes'] = parts[11] if len(parts) > 11 else ''          # blue
+                bom_record['Cust_Supplied'] = parts[12] if len(parts) > 12 else ''  # yellow
+                
+                bom_records.append(bom_record)
+    except Exception as e:
+        # Records parsed before the error are kept, as before
+        return bom_records, False, f"Error reading stdBOM file {stdbom_path}: {e}"
+
+    return bom_records, True, None
+
+def build_master_bom(jobs_df: pd.DataFrame, assembly_active_directory: str, debug_output: bool = False,
+                     directories: list = None) -> pd.DataFrame:
+    """
+    Scans assembly directories for stdBOM files and builds a master BOM DataFrame from active jobs.
+    
+    Args:
         jobs_df (pd.DataFrame): DataFrame containing active job data with WO# and Quote# columns
         assembly_active_directory (str): Path to directory containing assembly job folders
         debug_output (bool, optional): Whether to display debug information. Defaults to False.
+        directories (list, optional): Job directory names from list_job_directories().
+            assembly_active_directory is listed if None.
         
     Returns:
         pd.DataFrame: Master BOM DataFrame with all parts from active jobs' stdBOM files.
@@ -1092,16 +1743,14 @@ def build_master_bom(jobs_df: pd.DataFrame, assembly_active_directory: str, debu
     # Create a lookup dictionary for WO# to Quote# mapping
     wo_to_quote = {job.get('WO#', ''): job.get('Quote#', '') for job in jobs_df if job.get('WO#')}
     
-    # Get all directories in ASSEMBLY_ACTIVE_DIRECTORY
+    # Get all directories in ASSEMBLY_ACTIVE_DIRECTORY (reusing the camData scan's listing when given)
     if os.path.exists(assembly_active_directory):
-        directories = [d for d in os.listdir(assembly_active_directory) 
-                      if os.path.isdir(os.path.join(assembly_active_directory, d))]
-        
-        total_dirs = len(directories)
-        processed_count = 0
+        if directories is None:
+            directories = list_job_directories(assembly_active_directory)
         
-        for idx, directory in enumerate(directories):
-            # Check if any active WO# is part of the directory name
+        # Check if any active WO# is part of the directory name
+        dirs_to_read = []
+        for directory in directories:
             matching_wo = None
             for wo_number in active_wo_numbers:
                 if wo_number and wo_number in directory:
@@ -1109,65 +1758,24 @@ def build_master_bom(jobs_df: pd.DataFrame, assembly_active_directory: str, debu
                     break
             
             if matching_wo:
-                dir_path = os.path.join(assembly_active_directory, directory)
+                dirs_to_read.append((matching_wo, wo_to_quote.get(matching_wo, ''), os.path.join(assembly_active_directory, directory)))
+        
+        # Read the stdBOM files in parallel (network share reads are latency bound);
+        # map() returns results in directory order so the BOM row order is unchanged
+        total_dirs = len(dirs_to_read)
+        processed_count = 0
+        
+        with ThreadPoolExecutor(max_workers=FILE_SCAN_WORKERS) as executor:
+            results = executor.map(lambda job: _read_stdbom_records(*job), dirs_to_read)
+            for idx, (bom_records, parsed, error) in enumerate(results):
+                if error:
+                    print(error)
+                master_bom_data.extend(bom_records)
+                if parsed:
+                    processed_count += 1
                 
-                # Find stdBOM file in the directory
-                try:
-                    files = os.listdir(dir_path)
-                    stdbom_files = [f for f in files if 'stdBOM' in f and f.endswith('.txt')]
-                    
-                    if stdbom_files:
-                        # Use the first stdBOM file found
-                        stdbom_file = stdbom_files[0]
-                        stdbom_path = os.path.join(dir_path, stdbom_file)
-                        
-                        # Parse the stdBOM file
-                        try:
-                            with open(stdbom_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                lines = f.readlines()
-                                
-                            for line in lines:
-                                line = line.strip()
-                                if line and '|' in line:
-                                    # Split by pipe delimiter
-                                    parts = line.split('|')
-                                    
-                                    # Create BOM record with WO# as first column
-                                    bom_record = {
-                                        'WO#': matching_wo,
-                                        'Quote#': wo_to_quote.get(matching_wo, '')
-                                    }
-                                    
-                                    # Add all columns
-                                    if len(parts) >= 1:
-                                        bom_record['Part_Number'] = parts[0] if len(parts) > 0 else ''      # white
-                                        bom_record['MPN'] = parts[1] if len(parts) > 1 else ''              # blue
-                                        bom_record['API_URL'] = parts[2] if len(parts) > 2 else ''          # yellow
-                                        bom_record['Description'] = parts[3] if len(parts) > 3 else ''      # green
-                                        bom_record['Designators'] = parts[4] if len(parts) > 4 else ''      # orange
-                                        bom_record['Designator_Count'] = parts[5] if len(parts) > 5 else '' # lt blue
-                                        bom_record['Source'] = parts[6] if len(parts) > 6 else ''           # lt green
-                                        bom_record['Line_Number'] = parts[7] if len(parts) > 7 else ''      # teal - 0=pcb, 1000=stencil
-                                        bom_record['Req_Qty'] = parts[8] if len(parts) > 8 else ''          # med blue
-                                        bom_record['Recvd_Qty'] = parts[9] if len(parts) > 9 else ''        # red
-                                        bom_record['Date_Complete'] = parts[10] if len(parts) > 10 else ''  # white
-                                        bom_record['Notes'] = parts[11] if len(parts) > 11 else ''          # blue
-                                        bom_record['Cust_Supplied'] = parts[12] if len(parts) > 12 else ''  # yellow
-                                    
-                                    master_bom_data.append(bom_record)
-                                    
-                        except Exception as e:
-                            print(f"Error reading stdBOM file {stdbom_path}: {e}")
-                            continue
-                            
-                        processed_count += 1
-                        
-                except Exception as e:
-                    print(f"Error accessing directory {dir_path}: {e}")
-                    continue
-            
-            # Show progress
-            blue_gradient_bar(idx + 1, total_dirs, color_options[8])
+                # Show progress
+                blue_gradient_bar(idx + 1, total_dirs, color_options[8])
         
         # Newline after progress bar
         print()
@@ -1254,8 +1862,8 @@ def add_overage_to_master_bom(master_bom_df, QUOTE_DIR, apply_overage=True):
                                     excel_path = os.path.join(purchasing_dir, excel_file)
                                     
                                     try:
-                                        # Read the Excel file
-                                        purchasing_df = pd.read_excel(excel_path)
+                                        # Read the Excel file (only the two columns used for the lookup)
+                                        purchasing_df = pd.read_excel(excel_path, usecols=lambda column: column in ('MPN', 'Buy Quantity'))
                                         
                                         # Check if required columns exist
                                         if 'MPN' in purchasing_df.columns and 'Buy Quantity' in purchasing_df.columns:
@@ -1318,7 +1926,244 @@ def add_overage_to_master_bom(master_bom_df, QUOTE_DIR, apply_overage=True):
 
     return master_bom_with_overage
 
-def missing_purchase_parts_file(master_bom_df, LOG_MISSING_PURCH_PARTS, debug_output=False):
+def prepare_master_bom(master_bom_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepares the master BOM once for the missing parts, designator, PCB and stencil files:
+    stores the CATEGORICAL_BOM_FIELDS columns as categories and adds numeric Req_Qty_num and
+    Recvd_Qty_num columns so the quantities are not re-parsed for every file.
+
+    Args:
+        master_bom_df (pd.DataFrame): Master BOM DataFrame (after overage has been added)
+
+    Returns:
+        pd.DataFrame: Master BOM DataFrame with categorical fields and numeric quantity columns
+    """
+    if master_bom_df.empty:
+        return master_bom_df
+
+    for col in CATEGORICAL_BOM_FIELDS:
+        if col in master_bom_df.columns:
+            master_bom_df[col] = master_bom_df[col].astype('category')
+
+    master_bom_df['Req_Qty_num'] = _bom_quantity_series(_bom_column(master_bom_df, 'Req_Qty'))
+    master_bom_df['Recvd_Qty_num'] = _bom_quantity_series(_bom_column(master_bom_df, 'Recvd_Qty'))
+    return master_bom_df
+
+def _bom_column(master_bom_df: pd.DataFrame, column: str) -> pd.Series:
+    """Returns a master BOM column, or a column of '' when the BOM does not have it"""
+    if column in master_bom_df.columns:
+        return master_bom_df[column]
+    return pd.Series('', index=master_bom_df.index, dtype=object)
+
+def _bom_quantity_to_float(value):
+    """Converts a single BOM quantity the way the original row loops did: float(value), 0 if empty or invalid"""
+    try:
+        return float(value) if value else 0
+    except (ValueError, TypeError):
+        return 0
+
+def _bom_quantity_series(values: pd.Series) -> pd.Series:
+    """
+    Converts a BOM quantity column to floats. pd.to_numeric handles the common case in one pass;
+    only the values it cannot parse (blanks, '1_000', ...) go through _bom_quantity_to_float().
+
+    Args:
+        values (pd.Series): Raw Req_Qty/Recvd_Qty values
+
+    Returns:
+        pd.Series: Float quantities (0 for empty or invalid values)
+    """
+    quantities = pd.to_numeric(values, errors='coerce').astype(float)
+    unparsed = quantities.isna()
+    if unparsed.any():
+        quantities[unparsed] = values[unparsed].map(_bom_quantity_to_float).astype(float)
+    return quantities
+
+def _compute_bom_masks(master_bom_df: pd.DataFrame) -> dict:
+    """
+    Computes the row filters shared by the missing parts, designator, PCB and stencil files
+    in one vectorized pass over the master BOM instead of one iterrows() loop per file.
+
+    Args:
+        master_bom_df (pd.DataFrame): Master BOM DataFrame
+
+    Returns:
+        dict: Boolean Series keyed by:
+            - 'purchase_short': MPN is not PCB/Stencil, not customer supplied, received qty < required qty
+            - 'customer_short': MPN is not PCB/Stencil, customer supplied, received qty < required qty
+            - 'has_wo': WO# is not empty
+            - 'pcb': Part_Number is PCB
+            - 'stencil': Part_Number is Stencil
+    """
+    mpn = _bom_column(master_bom_df, 'MPN')
+    cust_supplied = _bom_column(master_bom_df, 'Cust_Supplied').str.lower()
+    wo_number = _bom_column(master_bom_df, 'WO#')
+    part_number = _bom_column(master_bom_df, 'Part_Number').str.upper()
+
+    # Numeric quantities are precomputed by prepare_master_bom()
+    if 'Req_Qty_num' in master_bom_df.columns and 'Recvd_Qty_num' in master_bom_df.columns:
+        req_qty = master_bom_df['Req_Qty_num']
+        recvd_qty = master_bom_df['Recvd_Qty_num']
+    else:
+        req_qty = _bom_quantity_series(_bom_column(master_bom_df, 'Req_Qty'))
+        recvd_qty = _bom_quantity_series(_bom_column(master_bom_df, 'Recvd_Qty'))
+
+    mpn_is_part = mpn.notna() & mpn.ne('') & ~mpn.str.upper().isin(['PCB', 'STENCIL'])
+    short = recvd_qty < req_qty
+
+    return {
+        'purchase_short': mpn_is_part & cust_supplied.isin(['false', 'no', '']) & short,
+        'customer_short': mpn_is_part & cust_supplied.isin(['true', 'yes']) & short,
+        'has_wo': wo_number.notna() & wo_number.ne(''),
+        'pcb': part_number.eq('PCB'),
+        'stencil': part_number.eq('STENCIL'),
+    }
+
+def _date_complete_is_set(values: pd.Series) -> pd.Series:
+    """
+    Checks which Date_Complete values hold a real date. A value counts as a date when it contains
+    a digit and a date separator ('-', '/', ':' or ' ') and pd.to_datetime can parse it; all values
+    are parsed in one pd.to_datetime call with unparseable values coerced to NaT.
+
+    Args:
+        values (pd.Series): Raw Date_Complete values
+
+    Returns:
+        pd.Series: True where Date_Complete contains a valid date
+    """
+    date_str = values.astype(str).str.strip()
+    looks_like_date = date_str.str.contains(r'\d') & date_str.str.contains(r'[-/: ]')
+
+    # format='mixed' parses each value on its own (like the scalar call); utc=True keeps values
+    # with different UTC offsets from affecting each other
+    parsed = pd.to_datetime(date_str.where(looks_like_date), errors='coerce', format='mixed', utc=True)
+    return looks_like_date & parsed.notna()
+
+def _selected_first_designators(master_bom_df: pd.DataFrame, mask: pd.Series, designators: pd.Series = None) -> pd.Series:
+    """Returns the first designators of the BOM rows selected by mask, reusing precomputed ones when given"""
+    if designators is not None:
+        return designators.loc[mask]
+    return first_designators(_bom_column(master_bom_df.loc[mask], 'Designators'))
+
+def _missing_parts_records(master_bom_df: pd.DataFrame, mask: pd.Series, designators: pd.Series = None) -> list:
+    """
+    Builds the missing parts records for the BOM rows selected by mask.
+
+    Args:
+        master_bom_df (pd.DataFrame): Master BOM DataFrame
+        mask (pd.Series): Boolean row filter from _compute_bom_masks()
+        designators (pd.Series, optional): First designators of the master BOM rows
+            (from build_bom_derivatives()). Computed for the selected rows if None.
+
+    Returns:
+        list: Records with WO#, Quote#, MPN, first designator, Req_Qty and Recvd_Qty
+    """
+    selected = master_bom_df.loc[mask]
+    return [
+        {
+            'WO#': wo_number,
+            'Quote#': quote_number,
+            'MPN': mpn,
+            'Designator': designator,
+            'Req_Qty': req_qty,
+            'Recvd_Qty': recvd_qty
+        }
+        for wo_number, quote_number, mpn, designator, req_qty, recvd_qty in zip(
+            _bom_column(selected, 'WO#'),
+            _bom_column(selected, 'Quote#'),
+            _bom_column(selected, 'MPN'),
+            _selected_first_designators(master_bom_df, mask, designators),
+            _bom_column(selected, 'Req_Qty'),
+            _bom_column(selected, 'Recvd_Qty'))
+    ]
+
+def _designators_by_wo(master_bom_df: pd.DataFrame, mask: pd.Series, designators: pd.Series = None) -> list:
+    """
+    Builds the designator summary records for the BOM rows selected by mask: the unique first
+    designators of each WO#, sorted and joined (or "many" if there are more than 10).
+
+    Args:
+        master_bom_df (pd.DataFrame): Master BOM DataFrame
+        mask (pd.Series): Boolean row filter from _compute_bom_masks()
+        designators (pd.Series, optional): First designators of the master BOM rows
+            (from build_bom_derivatives()). Computed for the selected rows if None.
+
+    Returns:
+        list: Records with WO# and Designators, sorted by WO#
+    """
+    selected = master_bom_df.loc[mask]
+    designator_rows = pd.DataFrame({
+        'WO#': _bom_column(selected, 'WO#'),
+        'Designators': _selected_first_designators(master_bom_df, mask, designators)
+    })
+    designator_rows = designator_rows[designator_rows['Designators'] != '']
+
+    # Unique designators sorted within each WO#, then joined per WO# with the builtin str.join
+    # (no Python lambda per group); more than 10 designators are reported as "many"
+    designator_rows = designator_rows.drop_duplicates().sort_values('Designators', kind='stable')
+    grouped = designator_rows.groupby('WO#', sort=True, observed=True)['Designators']
+    designators = grouped.agg(', '.join).where(grouped.size() <= 10, "many")
+
+    return designators.reset_index().to_dict(orient='records')
+
+def _status_by_wo(master_bom_df: pd.DataFrame, mask: pd.Series) -> list:
+    """
+    Builds the PCB/stencil status records for the BOM rows selected by mask. Status is "Complete"
+    if Date_Complete contains a date, otherwise "None"; the last row of a WO# wins.
+
+    Args:
+        master_bom_df (pd.DataFrame): Master BOM DataFrame
+        mask (pd.Series): Boolean row filter from _compute_bom_masks()
+
+    Returns:
+        list: Records with WO# and Status, sorted by WO#
+    """
+    selected = master_bom_df.loc[mask]
+    statuses = np.where(_date_complete_is_set(_bom_column(selected, 'Date_Complete')), "Complete", "None")
+
+    # Store the status (overwrites if multiple entries for same WO#)
+    wo_status = {}
+    for wo_number, status in zip(_bom_column(selected, 'WO#'), statuses):
+        wo_status[wo_number] = str(status)
+
+    # Sort by WO# for consistent output
+    status_data = [{'WO#': wo_number, 'Status': status} for wo_number, status in wo_status.items()]
+    status_data.sort(key=lambda x: x['WO#'])
+    return status_data
+
+def build_bom_derivatives(master_bom_df: pd.DataFrame) -> dict:
+    """
+    Builds the data for all missing parts, designator, PCB and stencil files in one go: the row
+    filters are computed once and the first designators are extracted once for the rows that are
+    short, instead of every file repeating both over the whole master BOM.
+
+    Args:
+        master_bom_df (pd.DataFrame): Master BOM DataFrame (after prepare_master_bom())
+
+    Returns:
+        dict: Records for each file keyed by 'missing_purch', 'purch_des', 'missing_cust',
+            'cust_des', 'pcb' and 'stencil'. Empty dict if the master BOM is empty.
+    """
+    if master_bom_df.empty:
+        return {}
+
+    masks = _compute_bom_masks(master_bom_df)
+
+    # First designators are only needed for purchase/customer short rows
+    short = masks['purchase_short'] | masks['customer_short']
+    designators = pd.Series('', index=master_bom_df.index, dtype=object)
+    designators[short] = first_designators(_bom_column(master_bom_df.loc[short], 'Designators')).to_numpy()
+
+    return {
+        'missing_purch': _missing_parts_records(master_bom_df, masks['purchase_short'], designators),
+        'purch_des': _designators_by_wo(master_bom_df, masks['purchase_short'] & masks['has_wo'], designators),
+        'missing_cust': _missing_parts_records(master_bom_df, masks['customer_short'], designators),
+        'cust_des': _designators_by_wo(master_bom_df, masks['customer_short'] & masks['has_wo'], designators),
+        'pcb': _status_by_wo(master_bom_df, masks['pcb'] & masks['has_wo']),
+        'stencil': _status_by_wo(master_bom_df, masks['stencil'] & masks['has_wo']),
+    }
+
+def missing_purchase_parts_file(master_bom_df, LOG_MISSING_PURCH_PARTS, debug_output=False, bom_derivatives=None):
     """
     Analyzes the master BOM DataFrame to identify missing purchase parts and saves the results to a JSON file.
     
@@ -1336,6 +2181,8 @@ def missing_purchase_parts_file(master_bom_df, LOG_MISSING_PURCH_PARTS, debug_ou
         LOG_MISSING_PURCH_PARTS (str): File path where the missing purchase parts JSON log should be saved
         debug_output (bool, optional): Whether to display sample missing parts data for debugging.
             Defaults to False.
+        bom_derivatives (dict, optional): Precomputed file data from build_bom_derivatives().
+            Computed from master_bom_df if None.
 
     Returns:
         None: Function saves results to JSON file and prints status messages. Does not return data.
@@ -1356,53 +2203,14 @@ def missing_purchase_parts_file(master_bom_df, LOG_MISSING_PURCH_PARTS, debug_ou
         print("Building missing purchase parts file...")
         
         # Filter the master BOM for missing purchase parts
-        missing_parts_data = []
+        if bom_derivatives:
+            missing_parts_data = bom_derivatives['missing_purch']
+        else:
+            missing_parts_data = _missing_parts_records(master_bom_df, _compute_bom_masks(master_bom_df)['purchase_short'])
 
+        # Show progress bar
         total_count = len(master_bom_df)
-        counter = 0
-        
-        for idx, row in master_bom_df.iterrows():
-            counter += 1
-            mpn = row.get('MPN', '')
-            cust_supplied = row.get('Cust_Supplied', '').lower()
-            req_qty = row.get('Req_Qty', '')
-            recvd_qty = row.get('Recvd_Qty', '')
-            
-            # Convert quantities to numeric for comparison, default to 0 if conversion fails
-            try:
-                req_qty_num = float(req_qty) if req_qty else 0
-            except (ValueError, TypeError):
-                req_qty_num = 0
-                
-            try:
-                recvd_qty_num = float(recvd_qty) if recvd_qty else 0
-            except (ValueError, TypeError):
-                recvd_qty_num = 0
-            
-            # Check conditions: MPN not PCB/Stencil, not customer supplied, received qty < required qty
-            if (mpn and 
-                mpn.upper() not in ['PCB', 'STENCIL'] and 
-                cust_supplied in ['false', 'no', ''] and 
-                recvd_qty_num < req_qty_num):
-                
-                # Extract first designator from comma-separated list
-                designators = row.get('Designators', '')
-                first_designator = extract_first_designator(designators)
-                
-                # Create missing parts record
-                missing_part = {
-                    'WO#': row.get('WO#', ''),
-                    'Quote#': row.get('Quote#', ''),
-                    'MPN': mpn,
-                    'Designator': first_designator,
-                    'Req_Qty': req_qty,
-                    'Recvd_Qty': recvd_qty
-                }
-                
-                missing_parts_data.append(missing_part)
-
-            # Show progress bar
-            blue_gradient_bar(counter, total_count, color_options[0])
+        blue_gradient_bar(total_count, total_count, color_options[0])
         # Newline after progress bar
         print()
         print()
@@ -1426,7 +2234,7 @@ def missing_purchase_parts_file(master_bom_df, LOG_MISSING_PURCH_PARTS, debug_ou
         # Create empty file
         save_json_file([], LOG_MISSING_PURCH_PARTS)
 
-def missing_purchase_parts_designator_file(master_bom_df, LOG_MISSING_PURCH_PARTS_DESIGNATOR, debug_output=False):
+def missing_purchase_parts_designator_file(master_bom_df, LOG_MISSING_PURCH_PARTS_DESIGNATOR, debug_output=False, bom_derivatives=None):
     """
     Creates a summary file of designators for missing purchase parts, grouped by work order.
     
@@ -1434,6 +2242,8 @@ def missing_purchase_parts_designator_file(master_bom_df, LOG_MISSING_PURCH_PART
         master_bom_df (pd.DataFrame): Master BOM DataFrame containing parts data
         LOG_MISSING_PURCH_PARTS_DESIGNATOR (str): File path for saving designator summary JSON
         debug_output (bool, optional): Whether to display sample data. Defaults to False.
+        bom_derivatives (dict, optional): Precomputed file data from build_bom_derivatives().
+            Computed from master_bom_df if None.
         
     Returns:
         None: Saves designator summary to JSON file. Groups designators by WO# and uses 
@@ -1442,64 +2252,12 @@ def missing_purchase_parts_designator_file(master_bom_df, LOG_MISSING_PURCH_PART
     if not master_bom_df.empty:
         print("Building missing purchase parts designator file...")
         
-        # Dictionary to collect designators by WO#
-        wo_designators = {}
-        
-        for idx, row in master_bom_df.iterrows():
-            mpn = row.get('MPN', '')
-            cust_supplied = row.get('Cust_Supplied', '').lower()
-            req_qty = row.get('Req_Qty', '')
-            recvd_qty = row.get('Recvd_Qty', '')
-            wo_number = row.get('WO#', '')
-            
-            # Convert quantities to numeric for comparison, default to 0 if conversion fails
-            try:
-                req_qty_num = float(req_qty) if req_qty else 0
-            except (ValueError, TypeError):
-                req_qty_num = 0
-                
-            try:
-                recvd_qty_num = float(recvd_qty) if recvd_qty else 0
-            except (ValueError, TypeError):
-                recvd_qty_num = 0
-            
-            # Check conditions: MPN not PCB/Stencil, not customer supplied, received qty < required qty
-            if (mpn and 
-                mpn.upper() not in ['PCB', 'STENCIL'] and 
-                cust_supplied in ['false', 'no', ''] and 
-                recvd_qty_num < req_qty_num and
-                wo_number):
-                
-                # Extract first designator
-                designators = row.get('Designators', '')
-                first_designator = extract_first_designator(designators)
-                
-                if first_designator:
-                    # Initialize WO# entry if not exists
-                    if wo_number not in wo_designators:
-                        wo_designators[wo_number] = set()
-                    
-                    # Add designator to set (prevents duplicates)
-                    wo_designators[wo_number].add(first_designator)
-        
-        # Convert to list format for JSON output
-        designator_data = []
-        for wo_number, designator_set in wo_designators.items():
-            designator_list = sorted(list(designator_set))
-            
-            # If more than 10 designators, use "many"
-            if len(designator_list) > 10:
-                designator_string = "many"
-            else:
-                designator_string = ", ".join(designator_list)
-            
-            designator_data.append({
-                'WO#': wo_number,
-                'Designators': designator_string
-            })
-        
-        # Sort by WO# for consistent output
-        designator_data.sort(key=lambda x: x['WO#'])
+        # Unique first designators grouped by WO# (sorted by WO# for consistent output)
+        if bom_derivatives:
+            designator_data = bom_derivatives['purch_des']
+        else:
+            masks = _compute_bom_masks(master_bom_df)
+            designator_data = _designators_by_wo(master_bom_df, masks['purchase_short'] & masks['has_wo'])
         
         print(f"Found designators for {len(designator_data)} work orders")
         
@@ -1521,7 +2279,7 @@ def missing_purchase_parts_designator_file(master_bom_df, LOG_MISSING_PURCH_PART
         # Create empty file
         save_json_file([], LOG_MISSING_PURCH_PARTS_DESIGNATOR)
 
-def missing_cust_parts_file(master_bom_df, LOG_MISSING_CUST_PARTS, debug_output=False):
+def missing_cust_parts_file(master_bom_df, LOG_MISSING_CUST_PARTS, debug_output=False, bom_derivatives=None):
     """
     Identifies and saves missing customer-supplied parts from the master BOM.
     
@@ -1529,6 +2287,8 @@ def missing_cust_parts_file(master_bom_df, LOG_MISSING_CUST_PARTS, debug_output=
         master_bom_df (pd.DataFrame): Master BOM DataFrame to analyze
         LOG_MISSING_CUST_PARTS (str): File path for saving missing customer parts JSON
         debug_output (bool, optional): Whether to display sample data. Defaults to False.
+        bom_derivatives (dict, optional): Precomputed file data from build_bom_derivatives().
+            Computed from master_bom_df if None.
         
     Returns:
         None: Saves missing customer parts data to JSON file. Includes parts where
@@ -1538,46 +2298,10 @@ def missing_cust_parts_file(master_bom_df, LOG_MISSING_CUST_PARTS, debug_output=
         print("Building missing customer parts file...")
         
         # Filter the master BOM for missing customer parts
-        missing_customer_parts_data = []
-        
-        for idx, row in master_bom_df.iterrows():
-            mpn = row.get('MPN', '')
-            cust_supplied = row.get('Cust_Supplied', '').lower()
-            req_qty = row.get('Req_Qty', '')
-            recvd_qty = row.get('Recvd_Qty', '')
-            
-            # Convert quantities to numeric for comparison, default to 0 if conversion fails
-            try:
-                req_qty_num = float(req_qty) if req_qty else 0
-            except (ValueError, TypeError):
-                req_qty_num = 0
-                
-            try:
-                recvd_qty_num = float(recvd_qty) if recvd_qty else 0
-            except (ValueError, TypeError):
-                recvd_qty_num = 0
-            
-            # Check conditions: MPN not PCB/Stencil, customer supplied is true, received qty < required qty
-            if (mpn and 
-                mpn.upper() not in ['PCB', 'STENCIL'] and 
-                cust_supplied in ['true', 'yes'] and 
-                recvd_qty_num < req_qty_num):
-                
-                # Extract first designator from comma-separated list
-                designators = row.get('Designators', '')
-                first_designator = extract_first_designator(designators)
-                
-                # Create missing customer parts record
-                missing_customer_part = {
-                    'WO#': row.get('WO#', ''),
-                    'Quote#': row.get('Quote#', ''),
-                    'MPN': mpn,
-                    'Designator': first_designator,
-                    'Req_Qty': req_qty,
-                    'Recvd_Qty': recvd_qty
-                }
-                
-                missing_customer_parts_data.append(missing_customer_part)
+        if bom_derivatives:
+            missing_customer_parts_data = bom_derivatives['missing_cust']
+        else:
+            missing_customer_parts_data = _missing_parts_records(master_bom_df, _compute_bom_masks(master_bom_df)['customer_short'])
         
         print(f"Found {len(missing_customer_parts_data)} missing customer parts")
         
@@ -1599,7 +2323,7 @@ def missing_cust_parts_file(master_bom_df, LOG_MISSING_CUST_PARTS, debug_output=
         # Create empty file
         save_json_file([], LOG_MISSING_CUST_PARTS)
 
-def missing_cust_parts_designator_file(master_bom_df, LOG_MISSING_CUST_PARTS_DESIGNATOR, debug_output=False):
+def missing_cust_parts_designator_file(master_bom_df, LOG_MISSING_CUST_PARTS_DESIGNATOR, debug_output=False, bom_derivatives=None):
     """
     Creates a summary file of designators for missing customer parts, grouped by work order.
     
@@ -1607,6 +2331,8 @@ def missing_cust_parts_designator_file(master_bom_df, LOG_MISSING_CUST_PARTS_DES
         master_bom_df (pd.DataFrame): Master BOM DataFrame containing parts data
         LOG_MISSING_CUST_PARTS_DESIGNATOR (str): File path for saving customer designator summary JSON
         debug_output (bool, optional): Whether to display sample data. Defaults to False.
+        bom_derivatives (dict, optional): Precomputed file data from build_bom_derivatives().
+            Computed from master_bom_df if None.
         
     Returns:
         None: Saves customer designator summary to JSON file. Groups designators by WO# 
@@ -1615,64 +2341,12 @@ def missing_cust_parts_designator_file(master_bom_df, LOG_MISSING_CUST_PARTS_DES
     if not master_bom_df.empty:
         print("Building missing customer parts designator file...")
         
-        # Dictionary to collect designators by WO#
-        wo_customer_designators = {}
-        
-        for idx, row in master_bom_df.iterrows():
-            mpn = row.get('MPN', '')
-            cust_supplied = row.get('Cust_Supplied', '').lower()
-            req_qty = row.get('Req_Qty', '')
-            recvd_qty = row.get('Recvd_Qty', '')
-            wo_number = row.get('WO#', '')
-            
-            # Convert quantities to numeric for comparison, default to 0 if conversion fails
-            try:
-                req_qty_num = float(req_qty) if req_qty else 0
-            except (ValueError, TypeError):
-                req_qty_num = 0
-                
-            try:
-                recvd_qty_num = float(recvd_qty) if recvd_qty else 0
-            except (ValueError, TypeError):
-                recvd_qty_num = 0
-            
-            # Check conditions: MPN not PCB/Stencil, customer supplied is true, received qty < required qty
-            if (mpn and 
-                mpn.upper() not in ['PCB', 'STENCIL'] and 
-                cust_supplied in ['true', 'yes'] and 
-                recvd_qty_num < req_qty_num and
-                wo_number):
-                
-                # Extract first designator
-                designators = row.get('Designators', '')
-                first_designator = extract_first_designator(designators)
-                
-                if first_designator:
-                    # Initialize WO# entry if not exists
-                    if wo_number not in wo_customer_designators:
-                        wo_customer_designators[wo_number] = set()
-                    
-                    # Add designator to set (prevents duplicates)
-                    wo_customer_designators[wo_number].add(first_designator)
-        
-        # Convert to list format for JSON output
-        customer_designator_data = []
-        for wo_number, designator_set in wo_customer_designators.items():
-            designator_list = sorted(list(designator_set))
-            
-            # If more than 10 designators, use "many"
-            if len(designator_list) > 10:
-                designator_string = "many"
-            else:
-                designator_string = ", ".join(designator_list)
-            
-            customer_designator_data.append({
-                'WO#': wo_number,
-                'Designators': designator_string
-            })
-        
-        # Sort by WO# for consistent output
-        customer_designator_data.sort(key=lambda x: x['WO#'])
+        # Unique first designators grouped by WO# (sorted by WO# for consistent output)
+        if bom_derivatives:
+            customer_designator_data = bom_derivatives['cust_des']
+        else:
+            masks = _compute_bom_masks(master_bom_df)
+            customer_designator_data = _designators_by_wo(master_bom_df, masks['customer_short'] & masks['has_wo'])
         
         print(f"Found customer designators for {len(customer_designator_data)} work orders")
         
@@ -1694,7 +2368,7 @@ def missing_cust_parts_designator_file(master_bom_df, LOG_MISSING_CUST_PARTS_DES
         # Create empty file
         save_json_file([], LOG_MISSING_CUST_PARTS_DESIGNATOR)
 
-def missing_pcb_file(master_bom_df, LOG_PCB_STATUS, debug_output=False):
+def missing_pcb_file(master_bom_df, LOG_PCB_STATUS, debug_output=False, bom_derivatives=None):
     """
     Analyzes master BOM to determine PCB completion status for each work order.
     
@@ -1702,6 +2376,8 @@ def missing_pcb_file(master_bom_df, LOG_PCB_STATUS, debug_output=False):
         master_bom_df (pd.DataFrame): Master BOM DataFrame containing PCB status data
         LOG_PCB_STATUS (str): File path for saving PCB status JSON
         debug_output (bool, optional): Whether to display sample data. Defaults to False.
+        bom_derivatives (dict, optional): Precomputed file data from build_bom_derivatives().
+            Computed from master_bom_df if None.
         
     Returns:
         None: Saves PCB status data to JSON file. Status is "Complete" if Date_Complete
@@ -1710,45 +2386,12 @@ def missing_pcb_file(master_bom_df, LOG_PCB_STATUS, debug_output=False):
     if not master_bom_df.empty:
         print("Building PCB status file...")
         
-        # Dictionary to collect PCB status by WO#
-        wo_pcb_status = {}
-        
-        for idx, row in master_bom_df.iterrows():
-            part_number = row.get('Part_Number', '').upper()
-            wo_number = row.get('WO#', '')
-            date_complete = row.get('Date_Complete', '')
-            
-            # Check if this is a PCB part
-            if part_number == 'PCB' and wo_number:
-                # Check if Date_Complete contains a date
-                pcb_status = "None"  # Default status
-                
-                if date_complete and str(date_complete).strip() and str(date_complete).lower() not in ['null', 'none', '']:
-                    # Try to parse as date to verify it's actually a date
-                    try:
-                        # Check if it looks like a date (contains numbers and date separators)
-                        date_str = str(date_complete).strip()
-                        if any(char.isdigit() for char in date_str) and any(sep in date_str for sep in ['-', '/', ':', ' ']):
-                            # Attempt to parse the date
-                            pd.to_datetime(date_str)
-                            pcb_status = "Complete"
-                    except (ValueError, TypeError):
-                        # If parsing fails, keep as "None"
-                        pcb_status = "None"
-                
-                # Store the status (overwrites if multiple PCB entries for same WO#)
-                wo_pcb_status[wo_number] = pcb_status
-        
-        # Convert to list format for JSON output
-        pcb_status_data = []
-        for wo_number, status in wo_pcb_status.items():
-            pcb_status_data.append({
-                'WO#': wo_number,
-                'Status': status
-            })
-        
-        # Sort by WO# for consistent output
-        pcb_status_data.sort(key=lambda x: x['WO#'])
+        # PCB status by WO# (sorted by WO# for consistent output)
+        if bom_derivatives:
+            pcb_status_data = bom_derivatives['pcb']
+        else:
+            masks = _compute_bom_masks(master_bom_df)
+            pcb_status_data = _status_by_wo(master_bom_df, masks['pcb'] & masks['has_wo'])
         
         print(f"Found PCB status for {len(pcb_status_data)} work orders")
         
@@ -1775,7 +2418,7 @@ def missing_pcb_file(master_bom_df, LOG_PCB_STATUS, debug_output=False):
         # Create empty file
         save_json_file([], LOG_PCB_STATUS)
 
-def missing_stencil_file(master_bom_df, LOG_STENCIL_STATUS, debug_output=False):
+def missing_stencil_file(master_bom_df, LOG_STENCIL_STATUS, debug_output=False, bom_derivatives=None):
     """
     Analyzes master BOM to determine stencil completion status for each work order.
     
@@ -1783,6 +2426,8 @@ def missing_stencil_file(master_bom_df, LOG_STENCIL_STATUS, debug_output=False):
         master_bom_df (pd.DataFrame): Master BOM DataFrame containing stencil status data
         LOG_STENCIL_STATUS (str): File path for saving stencil status JSON
         debug_output (bool, optional): Whether to display sample data. Defaults to False.
+        bom_derivatives (dict, optional): Precomputed file data from build_bom_derivatives().
+            Computed from master_bom_df if None.
         
     Returns:
         None: Saves stencil status data to JSON file. Status is "Complete" if Date_Complete
@@ -1791,45 +2436,12 @@ def missing_stencil_file(master_bom_df, LOG_STENCIL_STATUS, debug_output=False):
     if not master_bom_df.empty:
         print("Building stencil status file...")
         
-        # Dictionary to collect stencil status by WO#
-        wo_stencil_status = {}
-        
-        for idx, row in master_bom_df.iterrows():
-            part_number = row.get('Part_Number', '').upper()
-            wo_number = row.get('WO#', '')
-            date_complete = row.get('Date_Complete', '')
-            
-            # Check if this is a stencil part
-            if part_number == 'STENCIL' and wo_number:
-                # Check if Date_Complete contains a date
-                stencil_status = "None"  # Default status
-                
-                if date_complete and str(date_complete).strip() and str(date_complete).lower() not in ['null', 'none', '']:
-                    # Try to parse as date to verify it's actually a date
-                    try:
-                        # Check if it looks like a date (contains numbers and date separators)
-                        date_str = str(date_complete).strip()
-                        if any(char.isdigit() for char in date_str) and any(sep in date_str for sep in ['-', '/', ':', ' ']):
-                            # Attempt to parse the date
-                            pd.to_datetime(date_str)
-                            stencil_status = "Complete"
-                    except (ValueError, TypeError):
-                        # If parsing fails, keep as "None"
-                        stencil_status = "None"
-                
-                # Store the status (overwrites if multiple stencil entries for same WO#)
-                wo_stencil_status[wo_number] = stencil_status
-        
-        # Convert to list format for JSON output
-        stencil_status_data = []
-        for wo_number, status in wo_stencil_status.items():
-            stencil_status_data.append({
-                'WO#': wo_number,
-                'Status': status
-            })
-        
-        # Sort by WO# for consistent output
-        stencil_status_data.sort(key=lambda x: x['WO#'])
+        # stencil status by WO# (sorted by WO# for consistent output)
+        if bom_derivatives:
+            stencil_status_data = bom_derivatives['stencil']
+        else:
+            masks = _compute_bom_masks(master_bom_df)
+            stencil_status_data = _status_by_wo(master_bom_df, masks['stencil'] & masks['has_wo'])
         
         print(f"Found stencil status for {len(stencil_status_data)} work orders")
         
@@ -1856,7 +2468,83 @@ def missing_stencil_file(master_bom_df, LOG_STENCIL_STATUS, debug_output=False):
         # Create empty file
         save_json_file([], LOG_STENCIL_STATUS)
 
-def parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_output=False):
+def build_directory_name_index(directories: list) -> tuple:
+    """
+    Builds an index for find_directory_containing(): all directory names joined into one string
+    (separated by NUL, which cannot occur in file names) plus the offset where each name starts.
+
+    Args:
+        directories (list): Directory names in listing order
+
+    Returns:
+        tuple: (directories, joined_names, start_offsets)
+    """
+    start_offsets = []
+    offset = 0
+    for directory in directories:
+        start_offsets.append(offset)
+        offset += len(directory) + 1
+    return directories, '\0'.join(directories), start_offsets
+
+def find_directory_containing(text: str, directory_index: tuple):
+    """
+    Returns the first directory (in listing order) whose name contains text, like looping over the
+    directories with `if text in directory`, but as a single str.find() over all names.
+
+    Args:
+        text (str): Text to look for, e.g. a WO#
+        directory_index (tuple): Index returned by build_directory_name_index()
+
+    Returns:
+        str or None: Name of the first matching directory, or None if no directory matches
+    """
+    directories, joined_names, start_offsets = directory_index
+    if '\0' in text:
+        return None
+    position = joined_names.find(text)
+    if position == -1 or not directories:
+        return None
+    return directories[bisect.bisect_right(start_offsets, position) - 1]
+
+def _read_receiving_bom_po_numbers(dir_path: str) -> tuple:
+    """
+    Reads the PO numbers from the R4_RECEIVING_BOM file in a job directory. The PO number is the
+    first '|' separated value of each line; values that are not integers are skipped.
+
+    Args:
+        dir_path (str): Path to the job directory
+
+    Returns:
+        tuple: Two-element tuple containing:
+            - po_numbers (set): Unique PO numbers (empty if there is no R4_RECEIVING_BOM file)
+            - error (str or None): Error message if the directory or file could not be read
+    """
+    try:
+        # Find R4_RECEIVING_BOM file in the directory
+        files = os.listdir(dir_path)
+        receiving_bom_files = [f for f in files if 'R4_RECEIVING_BOM' in f]
+        if not receiving_bom_files:
+            return set(), None
+        
+        # Use the first R4_RECEIVING_BOM file found
+        receiving_bom_path = os.path.join(dir_path, receiving_bom_files[0])
+    except Exception as e:
+        return set(), f"Error accessing directory {dir_path}: {e}"
+
+    try:
+        with open(receiving_bom_path, 'rb') as f:
+            content = f.read()
+
+        # One regex pass over the whole file instead of a strip/split/int() per line. ASCII files
+        # (the usual case) are scanned as bytes without decoding them to a str first.
+        if content.isascii():
+            return {int(value) for value in _RECEIVING_BOM_PO_BYTES_RE.findall(content)}, None
+        text = content.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+        return {int(value) for value in _RECEIVING_BOM_PO_RE.findall(text)}, None
+    except Exception as e:
+        return set(), f"Error reading R4_RECEIVING_BOM file {receiving_bom_path}: {e}"
+
+def parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_output=False, directories=None):
     """
     Extracts PO numbers from R4_RECEIVING_BOM files for active jobs and saves to JSON.
     
@@ -1865,10 +2553,12 @@ def parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_
         ASSEMBLY_ACTIVE_DIRECTORY (str): Path to directory containing assembly job folders
         LOG_PO_NUMBERS (str): File path for saving PO numbers JSON
         debug_output (bool, optional): Whether to display sample data. Defaults to False.
+        directories (list, optional): Job directory names from list_job_directories().
+            ASSEMBLY_ACTIVE_DIRECTORY is listed if None.
         
     Returns:
-        None: Saves PO numbers data to JSON file. Each record contains WO# and 
-              comma-separated string of PO numbers found in R4_RECEIVING_BOM files.
+        list: The PO numbers records saved to the JSON file ([] if there are none). Each record
+              contains WO# and comma-separated string of PO numbers found in R4_RECEIVING_BOM files.
     """
     if active_jobs:
         print("Building PO numbers file...")
@@ -1878,76 +2568,43 @@ def parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_
         
         # Get all directories in ASSEMBLY_ACTIVE_DIRECTORY
         if os.path.exists(ASSEMBLY_ACTIVE_DIRECTORY):
-            directories = [d for d in os.listdir(ASSEMBLY_ACTIVE_DIRECTORY) 
-                          if os.path.isdir(os.path.join(ASSEMBLY_ACTIVE_DIRECTORY, d))]
-            
-            total_active_jobs = len(active_jobs)
-            processed_count = 0
-            
-            for idx, job in enumerate(active_jobs):
+            # Reuse the camData scan's directory listing when given
+            if directories is None:
+                directories = list_job_directories(ASSEMBLY_ACTIVE_DIRECTORY)
+            
+            # Find the directory for each active job's WO# using one index of all directory names
+            directory_index = build_directory_name_index(directories)
+            jobs_to_scan = []
+            for job in active_jobs:
                 wo_number = job.get('WO#', '')
                 
                 if wo_number:
                     # Find directory that contains the WO# (with preceding character)
-                    matching_dir = None
-                    for directory in directories:
-                        if wo_number in directory:
-                            matching_dir = directory
-                            break
+                    matching_dir = find_directory_containing(wo_number, directory_index)
                     
                     if matching_dir:
-                        dir_path = os.path.join(ASSEMBLY_ACTIVE_DIRECTORY, matching_dir)
-                        
-                        try:
-                            # Find R4_RECEIVING_BOM file in the directory
-                            files = os.listdir(dir_path)
-                            receiving_bom_files = [f for f in files if 'R4_RECEIVING_BOM' in f]
-                            
-                            if receiving_bom_files:
-                                # Use the first R4_RECEIVING_BOM file found
-                                receiving_bom_file = receiving_bom_files[0]
-                                receiving_bom_path = os.path.join(dir_path, receiving_bom_file)
-                                
-                                # Parse the R4_RECEIVING_BOM file
-                                po_numbers = set()  # Use set to store unique values
-                                
-                                try:
-                                    with open(receiving_bom_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                        lines = f.readlines()
-                                        
-                                    for line in lines:
-                                        line = line.strip()
-                                        if line and '|' in line:
-                                            # Split by pipe delimiter and get first value
-                                            parts = line.split('|')
-                                            if parts:
-                                                first_value = parts[0].strip()
-                                                
-                                                # Try to convert to integer
-                                                try:
-                                                    po_number = int(first_value)
-                                                    po_numbers.add(po_number)
-                                                except (ValueError, TypeError):
-                                                    # Not an integer, skip
-                                                    continue
-                                    
-                                    # Store PO numbers for this WO# if any found
-                                    if po_numbers:
-                                        # Convert set to sorted list for consistent output
-                                        po_list = sorted(list(po_numbers))
-                                        wo_po_numbers[wo_number] = po_list
-                                        processed_count += 1
-                                        
-                                except Exception as e:
-                                    print(f"Error reading R4_RECEIVING_BOM file {receiving_bom_path}: {e}")
-                                    continue
-                                    
-                        except Exception as e:
-                            print(f"Error accessing directory {dir_path}: {e}")
-                            continue
-                
-                # Show progress
-                blue_gradient_bar(idx + 1, total_active_jobs, color_options[5])
+                        jobs_to_scan.append((wo_number, os.path.join(ASSEMBLY_ACTIVE_DIRECTORY, matching_dir)))
+            
+            # Read the R4_RECEIVING_BOM files in parallel (network share reads are latency bound).
+            # Each directory is read once even if several jobs resolve to it; results are then
+            # walked in job order so later duplicates of a WO# still win
+            total_jobs_to_scan = len(jobs_to_scan)
+            processed_count = 0
+            unique_dir_paths = list(dict.fromkeys(dir_path for _, dir_path in jobs_to_scan))
+            
+            with ThreadPoolExecutor(max_workers=FILE_SCAN_WORKERS) as executor:
+                results_by_dir = dict(zip(unique_dir_paths, executor.map(_read_receiving_bom_po_numbers, unique_dir_paths)))
+                for idx, (wo_number, dir_path) in enumerate(jobs_to_scan):
+                    po_numbers, error = results_by_dir[dir_path]
+                    if error:
+                        print(error)
+                    elif po_numbers:
+                        # Convert set to sorted list for consistent output
+                        wo_po_numbers[wo_number] = sorted(po_numbers)
+                        processed_count += 1
+                    
+                    # Show progress
+                    blue_gradient_bar(idx + 1, total_jobs_to_scan, color_options[5])
             
             # Newline after progress bar
             print()
@@ -1981,6 +2638,8 @@ def parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_
                 print("\nSample PO numbers:")
                 for i, item in enumerate(po_numbers_data[:5]):
                     print(f"  {i+1}: WO#{item['WO#']} - {item['PO_Numbers']}")
+
+            return po_numbers_data
                     
         else:
             print(f"Assembly directory not found: {ASSEMBLY_ACTIVE_DIRECTORY}")
@@ -1992,75 +2651,135 @@ def parts_po_file(active_jobs, ASSEMBLY_ACTIVE_DIRECTORY, LOG_PO_NUMBERS, debug_
         # Create empty file
         save_json_file([], LOG_PO_NUMBERS)
 
+    return []
+
+def load_wo_status_lookups(LOG_MISSING_CUST_PARTS,
+                           LOG_MISSING_PURCH_PARTS,
+                           LOG_PCB_STATUS,
+                           LOG_STENCIL_STATUS) -> dict:
+    """
+    Loads the missing parts and PCB/stencil status log files once and builds the per-WO# lookups
+    shared by refine_active_jobs() and build_smartsheet_upload_df().
+
+    Args:
+        LOG_MISSING_CUST_PARTS (str): File path to missing customer parts JSON
+        LOG_MISSING_PURCH_PARTS (str): File path to missing purchase parts JSON
+        LOG_PCB_STATUS (str): File path to PCB status JSON
+        LOG_STENCIL_STATUS (str): File path to stencil status JSON
+
+    Returns:
+        dict: Lookups keyed by:
+            - 'missing_cust' (set): WO#s with missing customer parts
+            - 'missing_purch' (set): WO#s with missing purchase parts
+            - 'pcb_status' (dict): WO# -> PCB status
+            - 'stencil_status' (dict): WO# -> stencil status
+    """
+    missing_cust_parts, missing_purch_parts, pcb_status, stencil_status = load_json_files(
+        [LOG_MISSING_CUST_PARTS, LOG_MISSING_PURCH_PARTS, LOG_PCB_STATUS, LOG_STENCIL_STATUS], default_value=[])
+
+    return build_wo_status_lookups(missing_cust_parts, missing_purch_parts, pcb_status, stencil_status)
+
+def build_wo_status_lookups(missing_cust_parts: list,
+                            missing_purch_parts: list,
+                            pcb_status: list,
+                            stencil_status: list) -> dict:
+    """
+    Builds the per-WO# lookups of load_wo_status_lookups() from records already in memory
+    (e.g. the build_bom_derivatives() results), without reading the log files back.
+
+    Args:
+        missing_cust_parts (list): Missing customer parts records
+        missing_purch_parts (list): Missing purchase parts records
+        pcb_status (list): PCB status records
+        stencil_status (list): Stencil status records
+
+    Returns:
+        dict: Lookups keyed by 'missing_cust', 'missing_purch', 'pcb_status' and 'stencil_status'
+              (see load_wo_status_lookups())
+    """
+    def has_wo(entry):
+        # Missing WO#s are null in the log files, so NaN is skipped like None
+        wo_number = entry.get('WO#')
+        return bool(wo_number) and not (isinstance(wo_number, float) and np.isnan(wo_number))
+
+    return {
+        'missing_cust': {entry.get('WO#') for entry in missing_cust_parts if has_wo(entry)},
+        'missing_purch': {entry.get('WO#') for entry in missing_purch_parts if has_wo(entry)},
+        'pcb_status': {entry.get('WO#'): entry.get('Status', '') for entry in pcb_status if has_wo(entry)},
+        'stencil_status': {entry.get('WO#'): entry.get('Status', '') for entry in stencil_status if has_wo(entry)},
+    }
+
 def refine_active_jobs(LOG_ACTIVE_JOBS,
                        LOG_MISSING_CUST_PARTS,
                        LOG_MISSING_PURCH_PARTS,
                        LOG_PCB_STATUS,
-                       LOG_STENCIL_STATUS):
+                       LOG_STENCIL_STATUS,
+                       wo_lookups=None):
     """
     Refines the active jobs list by filtering based on completion criteria and adds internal status tracking.
     
     Args:
-        save_dir (str): Directory path for saving refined results
         LOG_ACTIVE_JOBS (str): File path to active jobs JSON
         LOG_MISSING_CUST_PARTS (str): File path to missing customer parts JSON
         LOG_MISSING_PURCH_PARTS (str): File path to missing purchase parts JSON
         LOG_PCB_STATUS (str): File path to PCB status JSON
         LOG_STENCIL_STATUS (str): File path to stencil status JSON
+        wo_lookups (dict, optional): Lookups from load_wo_status_lookups(). Loaded from the
+            log files if None.
         
     Returns:
-        None: Updates active jobs file and creates Excel file. Jobs are kept if they have
+        list: The refined active jobs, also saved to LOG_ACTIVE_JOBS. Jobs are kept if they have
               missing parts, incomplete PCBs, or incomplete stencils. Adds internal_status field.
     """
-    # Load log files
-    missing_cust_parts = load_json_file(LOG_MISSING_CUST_PARTS, default_value=[])
-    missing_purch_parts = load_json_file(LOG_MISSING_PURCH_PARTS, default_value=[])
-    pcb_status = load_json_file(LOG_PCB_STATUS, default_value=[])
-    stencil_status = load_json_file(LOG_STENCIL_STATUS, default_value=[])
+    if wo_lookups is None:
+        wo_lookups = load_wo_status_lookups(LOG_MISSING_CUST_PARTS, LOG_MISSING_PURCH_PARTS,
+                                            LOG_PCB_STATUS, LOG_STENCIL_STATUS)
 
-    # Build sets for fast lookup
-    wo_missing_cust = {entry.get('WO#') for entry in missing_cust_parts if entry.get('WO#')}
-    wo_missing_purch = {entry.get('WO#') for entry in missing_purch_parts if entry.get('WO#')}
-    pcb_status_dict = {entry.get('WO#'): entry.get('Status') for entry in pcb_status if entry.get('WO#')}
-    stencil_status_dict = {entry.get('WO#'): entry.get('Status') for entry in stencil_status if entry.get('WO#')}
+    # Sets/dicts for fast lookup
+    wo_missing_cust = wo_lookups['missing_cust']
+    wo_missing_purch = wo_lookups['missing_purch']
+    pcb_status_dict = wo_lookups['pcb_status']
+    stencil_status_dict = wo_lookups['stencil_status']
 
     # Load active jobs
     active_jobs_data = load_json_file(LOG_ACTIVE_JOBS, default_value=[])
 
-    refined_active_jobs = []
-    for job in active_jobs_data:
-        wo_number = job.get('WO#', '')
-        reasons = []
-
+    # The four criteria are evaluated for all jobs at once on the WO# column
+    wo_numbers = pd.Series([job.get('WO#', '') for job in active_jobs_data], dtype=object)
+    criteria = [
         # Criteria 1: Missing customer parts
-        if wo_number in wo_missing_cust:
-            reasons.append("missing_customer_parts")
-
+        (wo_numbers.isin(list(wo_missing_cust)), "missing_customer_parts"),
         # Criteria 2: Missing purchase parts
-        if wo_number in wo_missing_purch:
-            reasons.append("missing_purchase_parts")
-
+        (wo_numbers.isin(list(wo_missing_purch)), "missing_purchase_parts"),
         # Criteria 3: PCB status not complete
-        pcb_stat = pcb_status_dict.get(wo_number, None)
-        if pcb_stat != "Complete":
-            reasons.append("pcb_incomplete")
-
+        (wo_numbers.map(pcb_status_dict).ne("Complete"), "pcb_incomplete"),
         # Criteria 4: Stencil status not complete
-        stencil_stat = stencil_status_dict.get(wo_number, None)
-        if stencil_stat != "Complete":
-            reasons.append("stencil_incomplete")
+        (wo_numbers.map(stencil_status_dict).ne("Complete"), "stencil_incomplete"),
+    ]
+
+    # Pack the criteria that apply to each job into a bit mask (bit i = criteria i + 1)
+    reason_mask = np.zeros(len(wo_numbers), dtype=np.uint8)
+    for bit, (applies, _reason) in enumerate(criteria):
+        reason_mask |= applies.to_numpy(dtype=bool).astype(np.uint8) << bit
 
-        # If any reason applies, keep the job and set internal_status
-        if reasons:
-            job['internal_status'] = ", ".join(reasons)
-            refined_active_jobs.append(job)
+    # internal_status for every possible mask, joined once instead of per job
+    reasons = [reason for _applies, reason in criteria]
+    internal_status_by_mask = [", ".join(reason for bit, reason in enumerate(reasons) if mask >> bit & 1)
+                               for mask in range(1 << len(reasons))]
 
-        # Otherwise, remove from active jobs
+    # If any reason applies, keep the job and set internal_status; otherwise remove it from active jobs
+    refined_active_jobs = []
+    for position in np.flatnonzero(reason_mask).tolist():
+        job = active_jobs_data[position]
+        job['internal_status'] = internal_status_by_mask[reason_mask[position]]
+        refined_active_jobs.append(job)
 
     # Save refined active jobs back to LOG_ACTIVE_JOBS
     save_json_file(refined_active_jobs, LOG_ACTIVE_JOBS, create_dir=True)
     print(f"Refined active jobs: {len(refined_active_jobs)} records remain")
 
+    return refined_active_jobs
+
 def generate_statistics_file(cam_data: list, active_jobs: list, credit_hold_jobs: list):
     """
     Generates an Excel file with job statistics and active jobs detail for reporting purposes.
@@ -2094,8 +2813,15 @@ def generate_statistics_file(cam_data: list, active_jobs: list, credit_hold_jobs
     blue_gradient_bar(2, 4, color_options[4])
     excel_file_path = get_save_path('job_statistics.xlsx')
 
-    # Create Excel writer object
-    with pd.ExcelWriter(excel_file_path, engine='openpyxl') as writer:
+    # Create Excel writer object. xlsxwriter writes cells much faster than openpyxl and is used when
+    # installed (no constant_memory: pandas writes cells column by column, which that mode drops)
+    if xlsxwriter is not None:
+        excel_writer = pd.ExcelWriter(excel_file_path, engine='xlsxwriter',
+                                      engine_kwargs={'options': {'strings_to_urls': False}})
+    else:
+        excel_writer = pd.ExcelWriter(excel_file_path, engine='openpyxl')
+
+    with excel_writer as writer:
         
         # Step 3: Create Sheet 1 - Job Statistics Summary
         blue_gradient_bar(3, 4, color_options[5])
@@ -2109,8 +2835,8 @@ def generate_statistics_file(cam_data: list, active_jobs: list, credit_hold_jobs
         # Step 4: Create Sheet 2 - Active Jobs Detail from active jobs log file
         blue_gradient_bar(4, 4, color_options[6])
         try:
-            with open(get_save_path('log_active_jobs.json'), 'r') as file:
-                active_jobs_data = json.load(file)
+            with open(get_save_path('log_active_jobs.json'), 'rb') as file:
+                active_jobs_data = _loads_json(file.read())
             
             # Create DataFrame with specified columns
             if active_jobs_data:
@@ -2149,7 +2875,13 @@ def build_smartsheet_upload_df(LOG_ACTIVE_JOBS,
                                LOG_MISSING_PURCH_PARTS,
                                LOG_MISSING_CUST_PARTS,
                                LOG_PCB_STATUS,
-                               LOG_STENCIL_STATUS):
+                               LOG_STENCIL_STATUS,
+                               active_jobs_data=None,
+                               wo_lookups=None,
+                               user_entered_data=None,
+                               po_numbers_data=None,
+                               purch_designator_data=None,
+                               cust_designator_data=None):
     """
     Builds a DataFrame for Smartsheet upload by combining data from multiple log files.
     
@@ -2163,85 +2895,89 @@ def build_smartsheet_upload_df(LOG_ACTIVE_JOBS,
         LOG_MISSING_CUST_PARTS (str): Path to missing customer parts JSON file
         LOG_PCB_STATUS (str): Path to PCB status JSON file
         LOG_STENCIL_STATUS (str): Path to stencil status JSON file
+        active_jobs_data (list, optional): Refined active jobs already in memory (from
+            refine_active_jobs()). Loaded from LOG_ACTIVE_JOBS if None.
+        wo_lookups (dict, optional): Lookups from load_wo_status_lookups(). Loaded from the
+            log files if None.
+        user_entered_data (list, optional): Records returned by store_smartsheet_user_data().
+            Loaded from LOG_USER_ENTERED_DATA if None.
+        po_numbers_data (list, optional): Records returned by parts_po_file(). Loaded from
+            LOG_PO_NUMBERS if None.
+        purch_designator_data (list, optional): Purchase designator records (build_bom_derivatives()
+            'purch_des'). Loaded from LOG_PURCH_DESIGNATOR if None.
+        cust_designator_data (list, optional): Customer designator records (build_bom_derivatives()
+            'cust_des'). Loaded from LOG_CUSTOMER_DESIGNATORS if None.
         
     Returns:
         pd.DataFrame: Formatted DataFrame ready for Smartsheet upload with all relevant
                       job tracking information, status indicators, and refresh timestamps.
     """
-    # Load log_active_jobs.json
-    active_jobs_data = load_json_file(LOG_ACTIVE_JOBS, default_value=[])
+    # Load whichever of log_active_jobs.json, user entered data, PO numbers and designator data
+    # were not passed in, all together
+    log_data = [active_jobs_data, user_entered_data, po_numbers_data, purch_designator_data, cust_designator_data]
+    log_paths = [LOG_ACTIVE_JOBS, LOG_USER_ENTERED_DATA, LOG_PO_NUMBERS, LOG_PURCH_DESIGNATOR, LOG_CUSTOMER_DESIGNATORS]
+    missing = [position for position, data in enumerate(log_data) if data is None]
+    loaded = load_json_files([log_paths[position] for position in missing], default_value=[])
+    for position, data in zip(missing, loaded):
+        log_data[position] = data
+    active_jobs_data, user_entered_data, po_numbers_data, purch_designator_data, cust_designator_data = log_data
 
-    # Load user entered data
-    user_entered_data = load_json_file(LOG_USER_ENTERED_DATA, default_value=[])
     wo_user_data = {entry.get('WO#'): entry for entry in user_entered_data if entry.get('WO#')}
-
-    # Load PO numbers data
-    po_numbers_data = load_json_file(LOG_PO_NUMBERS, default_value=[])
     wo_po_numbers = {entry.get('WO#'): entry.get('PO_Numbers', '') for entry in po_numbers_data if entry.get('WO#')}
-
-    # Load designator data
-    purch_designator_data = load_json_file(LOG_PURCH_DESIGNATOR, default_value=[])
     wo_purch_designators = {entry.get('WO#'): entry.get('Designators', '') for entry in purch_designator_data if entry.get('WO#')}
-
-    cust_designator_data = load_json_file(LOG_CUSTOMER_DESIGNATORS, default_value=[])
     wo_cust_designators = {entry.get('WO#'): entry.get('Designators', '') for entry in cust_designator_data if entry.get('WO#')}
 
-    # Load missing parts data
-    missing_purch_parts = load_json_file(LOG_MISSING_PURCH_PARTS, default_value=[])
-    wo_missing_purch = {entry.get('WO#') for entry in missing_purch_parts if entry.get('WO#')}
+    # Load missing parts and PCB/Stencil status data
+    if wo_lookups is None:
+        wo_lookups = load_wo_status_lookups(LOG_MISSING_CUST_PARTS, LOG_MISSING_PURCH_PARTS,
+                                            LOG_PCB_STATUS, LOG_STENCIL_STATUS)
+    wo_missing_purch = wo_lookups['missing_purch']
+    wo_missing_cust = wo_lookups['missing_cust']
+    pcb_status_dict = wo_lookups['pcb_status']
+    stencil_status_dict = wo_lookups['stencil_status']
 
-    missing_cust_parts = load_json_file(LOG_MISSING_CUST_PARTS, default_value=[])
-    wo_missing_cust = {entry.get('WO#') for entry in missing_cust_parts if entry.get('WO#')}
-
-    # Load PCB and Stencil status data
-    pcb_status_data = load_json_file(LOG_PCB_STATUS, default_value=[])
-    pcb_status_dict = {entry.get('WO#'): entry.get('Status', '') for entry in pcb_status_data if entry.get('WO#')}
-
-    stencil_status_data = load_json_file(LOG_STENCIL_STATUS, default_value=[])
-    stencil_status_dict = {entry.get('WO#'): entry.get('Status', '') for entry in stencil_status_data if entry.get('WO#')}
-
-    # Start with log_active_jobs.json as base
-    update_rows = []
+    # Start with log_active_jobs.json as base, building each column in one pass
     current_datetime = datetime.now()
+    refresh_date = format_mmddyy(current_datetime.strftime('%m/%d/%y'))
+    refresh_time = current_datetime.strftime('%I:%M %p')
+    row_count = len(active_jobs_data)
+
+    wo_numbers = [job.get("WO#", "") for job in active_jobs_data]
+    wo_series = pd.Series(wo_numbers, dtype=object)
+    user_rows = [wo_user_data.get(wo_number, {}) for wo_number in wo_numbers]
+
+    update_columns = {
+        "Sales Order Date": format_mmddyy_values([job.get("Order Date", "") for job in active_jobs_data]),
+        "Turn": [job.get("Turn", "") for job in active_jobs_data],
+        "Due Date": format_mmddyy_values([job.get("Ship Date", "") for job in active_jobs_data]),
+        "WO#": wo_numbers,
+        "Quote #": [job.get("Quote#", "") for job in active_jobs_data],
+        "Customer": [job.get("Customer", "") for job in active_jobs_data],
+        "Date and Action": [user_data.get("Date and Action", "") for user_data in user_rows],
+        "Purchase Order": [wo_po_numbers.get(wo_number, "") for wo_number in wo_numbers],
+        "Purch Des": [wo_purch_designators.get(wo_number, "") for wo_number in wo_numbers],
+        "Cust Des": [wo_cust_designators.get(wo_number, "") for wo_number in wo_numbers],
+        "spacer": [""] * row_count,
+        "Pur Part": np.where(wo_series.isin(list(wo_missing_purch)), "P", "").tolist(),
+        "Cus Part": np.where(wo_series.isin(list(wo_missing_cust)), "C", "").tolist(),
+        "PCB": np.where(wo_series.map(pcb_status_dict).ne("Complete"), "PCB", "").tolist(),
+        "Stencil": np.where(wo_series.map(stencil_status_dict).ne("Complete"), "ST", "").tolist(),
+        "spacer2": [""] * row_count,
+        "Additional Notes": [user_data.get("Additional Notes", "") for user_data in user_rows],
+        "Refresh Date": [refresh_date] * row_count,
+        "Refresh Time": [refresh_time] * row_count
+    }
 
-    for job in active_jobs_data:
-        wo_number = job.get("WO#", "")
-        user_data = wo_user_data.get(wo_number, {})
-        pur_part_val = "P" if wo_number in wo_missing_purch else ""
-        cus_part_val = "C" if wo_number in wo_missing_cust else ""
-        pcb_val = "PCB" if pcb_status_dict.get(wo_number, "") != "Complete" else ""
-        stencil_val = "ST" if stencil_status_dict.get(wo_number, "") != "Complete" else ""
-
-        row = {
-            "Sales Order Date": format_mmddyy(job.get("Order Date", "")),
-            "Turn": job.get("Turn", ""),
-            "Due Date": format_mmddyy(job.get("Ship Date", "")),
-            "WO#": job.get("WO#", ""),
-            "Quote #": job.get("Quote#", ""),
-            "Customer": job.get("Customer", ""),
-            "Date and Action": user_data.get("Date and Action", ""),
-            "Purchase Order": wo_po_numbers.get(wo_number, ""),
-            "Purch Des": wo_purch_designators.get(wo_number, ""),
-            "Cust Des": wo_cust_designators.get(wo_number, ""),
-            "spacer": "",
-            "Pur Part": pur_part_val,
-            "Cus Part": cus_part_val,
-            "PCB": pcb_val,
-            "Stencil": stencil_val,
-            "spacer2": "",
-            "Additional Notes": user_data.get("Additional Notes", ""),
-            "Refresh Date": format_mmddyy(current_datetime.strftime('%m/%d/%y')),
-            "Refresh Time": current_datetime.strftime('%I:%M %p')
-        }
-        update_rows.append(row)
-
-    # Create DataFrame
-    smartsheet_update_df = pd.DataFrame(update_rows, columns=smartsheet_headers)
+    # Create DataFrame (an empty dict of lists would give float64 columns, keep them object)
+    if row_count:
+        smartsheet_update_df = pd.DataFrame(update_columns, columns=smartsheet_headers)
+    else:
+        smartsheet_update_df = pd.DataFrame(columns=smartsheet_headers)
 
     # Sort the data: rows with "Pur Part" values first, then by oldest due date at top
     if not smartsheet_update_df.empty:
         # Create a sorting helper column - 0 for rows with Pur Part values, 1 for empty
-        smartsheet_update_df['pur_part_sort'] = smartsheet_update_df['Pur Part'].apply(lambda x: 0 if x else 1)
+        smartsheet_update_df['pur_part_sort'] = np.where(smartsheet_update_df['Pur Part'].to_numpy(dtype=bool), 0, 1)
         
         # Convert Due Date to datetime for proper sorting
         smartsheet_update_df['due_date_sort'] = pd.to_datetime(smartsheet_update_df['Due Date'], errors='coerce')
@@ -2260,11 +2996,170 @@ def build_smartsheet_upload_df(LOG_ACTIVE_JOBS,
         smartsheet_update_df = smartsheet_update_df.drop(['pur_part_sort', 'due_date_sort'], axis=1)
 
     # Show sample for review
-    print("Sample Smartsheet update DataFrame:")
-    print(smartsheet_update_df.head())
+    if debug_output:
+        print("Sample Smartsheet update DataFrame:")
+        print(smartsheet_update_df.head())
 
     return smartsheet_update_df
 
+def smartsheet_column_ids(smartsheet_sheet, column_titles: list) -> list:
+    """
+    Maps DataFrame column titles to Smartsheet column IDs with one title -> ID dict built per call.
+    A title that is not on the sheet falls back to the sheet column at the same position.
+
+    Args:
+        smartsheet_sheet: Smartsheet sheet object (only its columns are used)
+        column_titles (list): Column titles in DataFrame order
+
+    Returns:
+        list: Smartsheet column ID for each title
+    """
+    sheet_columns = list(smartsheet_sheet.columns)
+    column_id_by_title = {column.title: column.id for column in sheet_columns}
+    return [column_id_by_title[title] if title in column_id_by_title else sheet_columns[position].id
+            for position, title in enumerate(column_titles)]
+
+def iter_batches(items: list, batch_size: int):
+    """
+    Yields consecutive slices of items, never larger than SMARTSHEET_MAX_ROWS_PER_REQUEST.
+
+    Args:
+        items (list): Rows or row IDs to send
+        batch_size (int): Requested batch size (e.g. ADD_BATCH_SIZE)
+
+    Yields:
+        tuple: (start_index, batch) for each batch
+    """
+    batch_size = max(1, min(batch_size, SMARTSHEET_MAX_ROWS_PER_REQUEST))
+    for i in range(0, len(items), batch_size):
+        yield i, items[i:i + batch_size]
+
+def call_with_backoff(func, *args, max_attempts: int = SMARTSHEET_MAX_ATTEMPTS):
+    """
+    Calls a Smartsheet SDK function, retrying with exponential backoff (2, 4, 8... seconds, at most 30)
+    when Smartsheet answers 429 (rate limited) or 503 (unavailable). The SDK already retries these
+    internally for up to SMARTSHEET_MAX_RETRY_TIME seconds; this covers bursts that outlast that window.
+    Both responses mean the request was not applied, so retrying an add/delete cannot duplicate rows.
+
+    Args:
+        func: SDK function to call, e.g. smartsheet_client.Sheets.add_rows
+        *args: Arguments for func
+        max_attempts (int): Total attempts before the error is raised (default: SMARTSHEET_MAX_ATTEMPTS)
+
+    Returns:
+        The result of func(*args)
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func(*args)
+        except smartsheet.exceptions.ApiError as e:
+            status_code = getattr(getattr(e.error, 'result', None), 'status_code', None)
+            if status_code not in (429, 503) or attempt == max_attempts:
+                raise
+            delay = min(30, 2 ** attempt)
+            logger.warning(f"Smartsheet returned {status_code}, retrying in {delay} seconds (attempt {attempt}/{max_attempts})")
+            time.sleep(delay)
+
+# Smartsheet cell formats for the Turn and Due Date columns
+_TURN_LONG_FORMAT = ",,,,,,,,,9,,0,,,,0,"
+_TURN_SHORT_FORMAT = ",,,,,,,,,0,,0,,,,0,"
+_DUE_OVERDUE_FORMAT = ",,,,,,,,2,19,,0,,,,0,"   # White text, red background
+_DUE_SOON_FORMAT = ",,,,,,,,2,28,,0,,,,0,"      # White text, orange background
+_DUE_LATER_FORMAT = ",,,,,,,,40,2,,0,,,,0,"     # Purple text, white background
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+def _turn_cell_format(turn_value) -> tuple:
+    """
+    Works out the Smartsheet cell format for a Turn value: highlighted for 7+ day turns.
+
+    Args:
+        turn_value: Turn value of the row
+
+    Returns:
+        tuple: (format string, None), or (None, error) if the value is not a number
+    """
+    try:
+        turn_num = float(str(turn_value).strip().upper())
+    except (ValueError, AttributeError) as e:
+        return None, e
+    if turn_num >= 7:
+        return _TURN_LONG_FORMAT, None
+    return _TURN_SHORT_FORMAT, None
+
+def _due_date_cell_format(due_value, today) -> tuple:
+    """
+    Works out the Smartsheet cell format for a Due Date value: red when overdue, orange when due
+    within 3 days, purple text otherwise.
+
+    Args:
+        due_value: Due Date value of the row
+        today (pd.Timestamp): Today's date (midnight)
+
+    Returns:
+        tuple: (format string or None if the value is not a date, None), or (None, error)
+    """
+    try:
+        due_date = pd.to_datetime(due_value, errors='coerce')
+        if pd.isnull(due_date):
+            return None, None
+
+        delta_days = (due_date - today).days
+        if delta_days < 0:
+            return _DUE_OVERDUE_FORMAT, None
+        if delta_days <= 3:
+            return _DUE_SOON_FORMAT, None
+        return _DUE_LATER_FORMAT, None
+    except Exception as ex:
+        return None, ex
+
+def _turn_cell_formats(turn_values: pd.Series) -> list:
+    """
+    Column-wise version of _turn_cell_format(). Plain int/float values are compared in one
+    vectorized step; anything else (strings, blanks) goes through _turn_cell_format().
+
+    Args:
+        turn_values (pd.Series): Turn column of the upload DataFrame
+
+    Returns:
+        list: (format string, error) tuple for each row
+    """
+    is_number = np.array([isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+                          for value in turn_values], dtype=bool)
+    numbers = pd.to_numeric(turn_values.where(is_number), errors='coerce').to_numpy(dtype=float)
+    formats = np.where(numbers >= 7, _TURN_LONG_FORMAT, _TURN_SHORT_FORMAT).tolist()
+
+    return [(cell_format, None) if number_value else _turn_cell_format(value)
+            for value, number_value, cell_format in zip(turn_values, is_number, formats)]
+
+def _due_date_cell_formats(due_values: pd.Series, today) -> list:
+    """
+    Column-wise version of _due_date_cell_format(). YYYY-MM-DD dates (what format_mmddyy()
+    produces) are parsed and compared to today in one vectorized step; any other value is
+    parsed on its own with _due_date_cell_format(), once per distinct value.
+
+    Args:
+        due_values (pd.Series): Due Date column of the upload DataFrame
+        today (pd.Timestamp): Today's date (midnight)
+
+    Returns:
+        list: (format string or None, error) tuple for each row
+    """
+    is_iso_date = due_values.map(lambda value: isinstance(value, str) and _ISO_DATE_RE.match(value) is not None)
+    due_dates = pd.to_datetime(due_values.where(is_iso_date), format='%Y-%m-%d', errors='coerce')
+    delta_days = (due_dates - today).dt.days
+    formats = np.select([delta_days < 0, delta_days <= 3, delta_days.notna()],
+                        [_DUE_OVERDUE_FORMAT, _DUE_SOON_FORMAT, _DUE_LATER_FORMAT], default='').tolist()
+
+    # Values the vectorized parse could not handle are parsed one distinct value at a time
+    fallback_values = set(due_values[due_dates.isna()])
+    fallback_formats = {value: _due_date_cell_format(value, today) for value in fallback_values}
+
+    return [(cell_format, None) if pd.notna(due_date) else fallback_formats[value]
+            for value, due_date, cell_format in zip(due_values, due_dates, formats)]
+
+# Cell value types the SDK's Cell model keeps (it silently drops any other value)
+_SMARTSHEET_CELL_VALUE_TYPES = (str, int, float, bool)
+
 def update_smartsheet(smartsheet_update_df, 
                       smartsheet_client, 
                       assembly_part_tracking_id, 
@@ -2290,7 +3185,7 @@ def update_smartsheet(smartsheet_update_df,
         
         # Get all row IDs from the current Smartsheet
         if '_row_id' in smartsheet_part_tracking_df.columns:
-            all_row_ids = smartsheet_part_tracking_df['_row_id'].tolist()
+            all_row_ids = smartsheet_part_tracking_df['_row_id'].dropna().astype('int64').tolist()
             logger.debug(f"Found {len(all_row_ids)} existing row IDs")
         else:
             all_row_ids = []
@@ -2299,22 +3194,25 @@ def update_smartsheet(smartsheet_update_df,
         # Delete all rows in batches
         logger.info(f"Deleting {len(all_row_ids)} rows from Smartsheet in batches of {DELETE_BATCH_SIZE}...")
         print(f"Deleting {len(all_row_ids)} rows from Smartsheet in batches of {DELETE_BATCH_SIZE}...")
-        for i in range(0, len(all_row_ids), DELETE_BATCH_SIZE):
-            batch_ids = all_row_ids[i:i+DELETE_BATCH_SIZE]
-            if batch_ids:
-                try:
-                    smartsheet_client.Sheets.delete_rows(assembly_part_tracking_id, batch_ids)
-                    logger.debug(f"Deleted batch: rows {i+1} to {i+len(batch_ids)}")
-                    print(f"Deleted rows {i+1} to {i+len(batch_ids)}")
-                except Exception as e:
-                    logger.error(f"Error deleting batch {i//DELETE_BATCH_SIZE + 1}: {e}")
-                    raise
+        # Batches are sent one at a time: concurrent writes to the same sheet fail with save collisions
+        # (4004), and a failed batch must stop the deletes that follow it
+        for i, batch_ids in iter_batches(all_row_ids, DELETE_BATCH_SIZE):
+            if not batch_ids:
+                continue
+            try:
+                call_with_backoff(smartsheet_client.Sheets.delete_rows, assembly_part_tracking_id, batch_ids)
+                logger.debug(f"Deleted batch: rows {i+1} to {i+len(batch_ids)}")
+                print(f"Deleted rows {i+1} to {i+len(batch_ids)}")
+            except Exception as e:
+                logger.error(f"Error deleting batch starting at row {i+1}: {e}")
+                raise
 
         # Replace NaN values with empty strings before uploading to Smartsheet
         smartsheet_update_df = smartsheet_update_df.replace({np.nan: ""})
         logger.debug("Replaced NaN values with empty strings")
 
-        # Prepare new rows for Smartsheet
+        # Prepare new rows for Smartsheet as plain dicts in the API's JSON shape; the SDK accepts
+        # them in place of Row/Cell models and serializes them without walking model properties
         new_rows = []
         format_part_columns = ['Pur Part', 'Cus Part', 'PCB', 'Stencil']
         format_turn_column = 'Turn'
@@ -2323,68 +3221,65 @@ def update_smartsheet(smartsheet_update_df,
         logger.info("Building rows with formatting...")
         formatting_errors = 0
 
-        for idx, row in smartsheet_update_df.iterrows():
+        # Column IDs, Turn formats and Due Date formats are worked out once up front instead of per cell
+        columns = list(smartsheet_update_df.columns)
+        column_ids = smartsheet_column_ids(smartsheet_sheet, columns)
+        part_column_flags = [col in format_part_columns for col in columns]
+
+        turn_formats = [None] * len(smartsheet_update_df)
+        if format_turn_column in columns:
+            turn_formats = _turn_cell_formats(smartsheet_update_df[format_turn_column])
+
+        due_formats = [None] * len(smartsheet_update_df)
+        if format_due_column in columns:
+            today = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
+            due_formats = _due_date_cell_formats(smartsheet_update_df[format_due_column], today)
+
+        for idx, row_values, turn_format, due_format in zip(smartsheet_update_df.index,
+                                                            smartsheet_update_df.itertuples(index=False, name=None),
+                                                            turn_formats, due_formats):
             try:
                 cells = []
-                for col in smartsheet_update_df.columns:
+                for col, col_id, is_part_column, value in zip(columns, column_ids, part_column_flags, row_values):
                     try:
-                        col_id = smartsheet_sheet.columns[smartsheet_update_df.columns.get_loc(col)].id
-                        cell = smartsheet.models.Cell()
-                        cell.column_id = col_id
-                        cell.value = row[col]
+                        cell = {'columnId': col_id}
+                        if isinstance(value, _SMARTSHEET_CELL_VALUE_TYPES):
+                            cell['value'] = value
 
                         # Apply formatting for part status columns (Pur Part, Cus Part, PCB, Stencil)
-                        if col in format_part_columns:
-                            if row[col]:  # If there is text in the cell
-                                cell.format = ",,,,,,,,2,19,,0,,,,0,"   # White text, red background for active status
+                        if is_part_column:
+                            if value:  # If there is text in the cell
+                                cell['format'] = ",,,,,,,,2,19,,0,,,,0,"   # White text, red background for active status
                             else:  # If cell is empty
-                                cell.format = ",,,,,,,,14,14,,0,,,,0,"  # Green text and background
+                                cell['format'] = ",,,,,,,,14,14,,0,,,,0,"  # Green text and background
                     
                         # Apply formatting for Turn column
                         if col == format_turn_column:
-                            try:
-                                turn_value = str(row[col]).strip().upper()
-                                turn_num = float(turn_value)
-                                if turn_num >= 7:
-                                    cell.format = ",,,,,,,,,9,,0,,,,0,"
-                                else:
-                                    cell.format = ",,,,,,,,,0,,0,,,,0,"
-                            except (ValueError, AttributeError) as e:
-                                logger.debug(f"Turn formatting error for row {idx}: {e}")
+                            cell_format, error = turn_format
+                            if error:
+                                logger.debug(f"Turn formatting error for row {idx}: {error}")
                                 formatting_errors += 1
+                            elif cell_format:
+                                cell['format'] = cell_format
 
                         # Apply formatting for Due Date column
                         if col == format_due_column:
-                            try:
-                                due_date = pd.to_datetime(row[col], errors='coerce')
-
-                                if pd.notnull(due_date):
-                                    today = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
-                                    delta_days = (due_date - today).days
-
-                                    cell.format = ",,,,,,,,40,2,,0,,,,0,"   # Purple text, white background
-                                    
-                                    if delta_days < 0:
-                                        cell.format = ",,,,,,,,2,19,,0,,,,0,"   # White text, red background
-                                    elif delta_days <= 3:
-                                        cell.format = ",,,,,,,,2,28,,0,,,,0,"   # White text, orange background
-
-                            except Exception as ex:
-                                logger.debug(f"Due date formatting error for row {idx}: {ex}")
+                            cell_format, error = due_format
+                            if error:
+                                logger.debug(f"Due date formatting error for row {idx}: {error}")
                                 formatting_errors += 1
+                            elif cell_format:
+                                cell['format'] = cell_format
                         
                         cells.append(cell)
                     except Exception as cell_err:
                         logger.error(f"Error processing cell in column '{col}' for row {idx}: {cell_err}")
                         raise
                         
-                new_row = smartsheet.models.Row()
-                new_row.to_bottom = True
-                new_row.cells = cells
-                new_rows.append(new_row)
+                new_rows.append({'cells': cells, 'toBottom': True})
             except Exception as row_err:
                 logger.error(f"Error building row {idx}: {row_err}")
-                logger.error(f"Row data: {row.to_dict()}")
+                logger.error(f"Row data: {dict(zip(columns, row_values))}")
                 raise
 
         if formatting_errors > 0:
@@ -2393,14 +3288,14 @@ def update_smartsheet(smartsheet_update_df,
         # Add new rows in batches
         logger.info(f"Adding {len(new_rows)} rows to Smartsheet in batches of {ADD_BATCH_SIZE}...")
         print(f"Adding {len(new_rows)} rows to Smartsheet in batches of {ADD_BATCH_SIZE}...")
-        for i in range(0, len(new_rows), ADD_BATCH_SIZE):
-            batch_rows = new_rows[i:i+ADD_BATCH_SIZE]
+        # Batches are sent one at a time: rows are added to the bottom, so order matters
+        for i, batch_rows in iter_batches(new_rows, ADD_BATCH_SIZE):
             try:
-                smartsheet_client.Sheets.add_rows(assembly_part_tracking_id, batch_rows)
+                call_with_backoff(smartsheet_client.Sheets.add_rows, assembly_part_tracking_id, batch_rows)
                 logger.debug(f"Added batch: rows {i+1} to {i+len(batch_rows)}")
                 print(f"Added rows {i+1} to {i+len(batch_rows)}")
             except Exception as e:
-                logger.error(f"Error adding batch {i//ADD_BATCH_SIZE + 1}: {e}")
+                logger.error(f"Error adding batch starting at row {i+1}: {e}")
                 logger.error(f"Batch size: {len(batch_rows)} rows")
                 raise
 
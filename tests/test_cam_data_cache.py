@@ -0,0 +1,74 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# local_secrets.py is not checked in; functions.py only needs its credential paths at import time
+if importlib.util.find_spec('local_secrets') is None:
+    local_secrets = types.ModuleType('local_secrets')
+    local_secrets.PASSWORD_FILE_PATH = local_secrets.ENCRYPTED_KEY_PATH = ''
+    local_secrets.SQL_PASSWORD_PATH = local_secrets.SQL_PASSWORD_KEY_PATH = ''
+    sys.modules['local_secrets'] = local_secrets
+
+import functions
+
+
+def typed_records(records):
+    """Records with each value paired with its type, so 3 and 3.0 do not compare equal"""
+    return [{key: (type(value).__name__, value) for key, value in record.items()} for record in records]
+
+
+class CamDataRoundTripTest(unittest.TestCase):
+    """save_cam_data() -> load_cam_data() returns the same records from Parquet and from JSON"""
+
+    def round_trip(self, df, fast_io):
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(functions, 'FAST_IO', fast_io):
+            log_path = os.path.join(directory, 'log_camData.json')
+            self.assertTrue(functions.save_cam_data(df.copy(), log_path))
+            saved_path = functions.get_cam_data_parquet_path(log_path) if fast_io else log_path
+            self.assertTrue(os.path.isfile(saved_path))
+            return functions.load_cam_data(log_path)
+
+    def assert_same_records(self, df):
+        if functions.pq is None:
+            self.skipTest("pyarrow is not installed")
+        parquet_records = self.round_trip(df, True)
+        json_records = self.round_trip(df, False)
+        self.assertEqual(typed_records(parquet_records), typed_records(json_records))
+        return json_records
+
+    def test_sanitized_int_blank_and_missing_fields(self):
+        raw = pd.DataFrame([
+            {'WO#': '10001_01', 'Customer': 'A', 'Qty': '3', 'Turn': '5', 'Line Items': '12'},
+            {'WO#': '10002_01', 'Customer': 'B', 'Qty': '4', 'Turn': '', 'Line Items': '7'},
+            {'WO#': '10003_01', 'Customer': None, 'Line Items': '2'},
+            {'WO#': '10004_01', 'Customer': 'A', 'Qty': '7', 'Turn': '2', 'Line Items': 'n/a'},
+        ])
+        df, _ = functions.sanitize_cam_data(raw)
+
+        records = self.assert_same_records(df)
+        self.assertEqual([record['Qty'] for record in records], [3, 4, None, 7])
+        self.assertEqual([record['Turn'] for record in records], [5, '', None, 2])
+
+    def test_int_column_with_none(self):
+        df = pd.DataFrame({
+            'WO#': ['10001_01', '10002_01'],
+            'Qty': pd.Series([np.int64(3), None], dtype=object),
+            'Line Items': [1, 2],
+            'Price': [1.5, np.nan],
+        })
+
+        records = self.assert_same_records(df)
+        self.assertEqual([record['Qty'] for record in records], [3, None])
+
+
+if __name__ == '__main__':
+    unittest.main()